@@ -0,0 +1,273 @@
+# Creates all the city data of the addon from wmo_full_city_list.csv:
+#
+#   ../pkg/cities.bin          the city table the addon uses to look up cities
+#   ../manifest.json           the list of countries in the settings
+#   manifest_fragment.json     the same list of countries, as a piece of the manifest schema
+#   city_catalogue.json        every city ID with its name, and a checksum of cities.bin
+#
+# The output only depends on the input, so running it twice gives the same files.
+# Cities that were added, removed or renamed since the last run are listed, using the previous city_catalogue.json.
+#
+# The location, time zone and station of each city are only in the city files of the WMO (<id>_en.json).
+# Downloaded city files can be added to city_metadata.json, which is kept in git, so the addon never has to download them just for that:
+#
+# python3 generate_city_data.py --city-json example_city_data.json --city-json ~/.webthings/data/candle-weather/http_cache
+#
+# Directories are searched for .json and .body files (the cache of the addon stores them as .body files).
+#
+# python3 generate_city_data.py
+
+import os
+import csv
+import sys
+import json
+import hashlib
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pkg.city_table import pack_city_table
+
+
+UPDATE_PATH = os.path.dirname(os.path.abspath(__file__))
+CSV_PATH = os.path.join(UPDATE_PATH, 'wmo_full_city_list.csv')
+TABLE_PATH = os.path.join(UPDATE_PATH, '..', 'pkg', 'cities.bin')
+MANIFEST_PATH = os.path.join(UPDATE_PATH, '..', 'manifest.json')
+FRAGMENT_PATH = os.path.join(UPDATE_PATH, 'manifest_fragment.json')
+CATALOGUE_PATH = os.path.join(UPDATE_PATH, 'city_catalogue.json')
+METADATA_PATH = os.path.join(UPDATE_PATH, 'city_metadata.json')
+
+# Very long official country names are shortened
+COUNTRY_ALIASES = {
+    "United States of America": "USA",
+    "Russian Federation": "Russia",
+    "United Kingdom of Great Britain and Northern Ireland": "UK",
+    "Iran, Islamic Republic of": "Iran",
+    "Venezuela, Bolivarian Republic of": "Venezuela",
+    "Syrian Arab Republic": "Syria",
+    "United Republic of Tanzania": "Tanzania",
+    "Lao People's Democratic Republic": "Lao",
+}
+
+CITY_RENAMES = {
+    "Castellon de la Plana/Castello de la Plana": "Castellon de la Plana",
+    "Port of Spain (Trinidad)": "Port of Spain",
+    "Scarborough (Tobago)": "Scarborough",
+}
+
+# How the country list is indented in manifest.json
+_ENUM_ITEM_INDENT = '\t\t\t  '
+
+
+
+# Returns a list of city dictionaries, sorted by name
+def read_cities(csv_path=CSV_PATH):
+    cities = {}
+    with open(csv_path, 'r', encoding='utf-8') as file:
+        reader = csv.reader(file, delimiter=';')
+        for each_row in reader:
+            # skips the header, and the extra line at the bottom of the WMO list
+            if len(each_row) < 3 or not each_row[2].strip().isdigit():
+                continue
+            country = COUNTRY_ALIASES.get(each_row[0].strip(), each_row[0].strip())
+            city = CITY_RENAMES.get(each_row[1].strip(), each_row[1].strip())
+            name = country + " - " + city
+            if name in cities:
+                print("warning, skipping duplicate city: " + name)
+                continue
+            cities[name] = {
+                'name': name,
+                'city_id': int(each_row[2]),
+            }
+    return sorted(cities.values(), key=lambda city: city['name'].encode('utf-8'))
+
+
+
+# '+0200' -> 120, '-0330' -> -210
+def parse_time_zone(text):
+    text = str(text).strip()
+    if len(text) != 5 or not text[0] in '+-' or not text[1:].isdigit():
+        return None
+    minutes = int(text[1:3]) * 60 + int(text[3:5])
+    return -minutes if text[0] == '-' else minutes
+
+
+
+def parse_coordinate(text, limit):
+    try:
+        coordinate = float(text)
+    except (TypeError, ValueError):
+        return None
+    if coordinate != coordinate or abs(coordinate) > limit: # NaN or out of range
+        return None
+    return round(coordinate, 6)
+
+
+
+# Returns (city ID, metadata) from the contents of a WMO city file, or None if it is not one
+def read_city_json(data):
+    try:
+        city = json.loads(data.decode('utf-8'))['city']
+        city_id = str(int(city['cityId']))
+    except Exception:
+        return None
+
+    metadata = {}
+    latitude = parse_coordinate(city.get('cityLatitude'), 90)
+    longitude = parse_coordinate(city.get('cityLongitude'), 180)
+    if latitude != None and longitude != None:
+        metadata['latitude'] = latitude
+        metadata['longitude'] = longitude
+    time_zone = parse_time_zone(city.get('timeZone', ''))
+    if time_zone != None:
+        metadata['time_zone'] = time_zone
+    if city.get('isDST') in ('Y', 'N'):
+        metadata['dst'] = city['isDST'] == 'Y'
+    if str(city.get('stationName', '')).strip() != '':
+        metadata['station'] = str(city['stationName']).strip()
+    member = city.get('member')
+    if isinstance(member, dict) and str(member.get('orgName', '')).strip() != '':
+        metadata['organisation'] = str(member['orgName']).strip()
+    return city_id, metadata
+
+
+
+# Adds what is in the given city files and directories to the metadata. Returns the number of cities that changed.
+def enrich(metadata, paths):
+    files = []
+    for path in paths:
+        path = os.path.expanduser(path)
+        if os.path.isdir(path):
+            for file_name in sorted(os.listdir(path)):
+                if file_name.endswith('.json') or file_name.endswith('.body'):
+                    files.append(os.path.join(path, file_name))
+        else:
+            files.append(path)
+
+    changed = 0
+    for file_path in files:
+        with open(file_path, 'rb') as file:
+            found = read_city_json(file.read())
+        if found == None:
+            continue
+        city_id, city_metadata = found
+        if len(city_metadata) > 0 and metadata.get(city_id) != city_metadata:
+            metadata[city_id] = city_metadata
+            changed += 1
+    return changed
+
+
+
+def get_countries(cities):
+    countries = []
+    for city in cities:
+        country = city['name'].split(' - ', 1)[0]
+        if not country in countries:
+            countries.append(country)
+    return countries
+
+
+
+def write_if_changed(path, data):
+    if os.path.isfile(path):
+        with open(path, 'rb') as file:
+            if file.read() == data:
+                return False
+    with open(path, 'wb') as file:
+        file.write(data)
+    return True
+
+
+
+# Replaces the list of countries in manifest.json, and leaves the rest of the file exactly as it is
+def update_manifest(countries, manifest_path=MANIFEST_PATH):
+    with open(manifest_path, 'r', encoding='utf-8') as file:
+        lines = file.read().split('\n')
+
+    start = lines.index('        "Country": {')
+    enum_start = lines.index('          "enum": [', start) + 1
+    enum_end = lines.index('          ],', enum_start)
+
+    items = []
+    for i, country in enumerate(countries):
+        items.append(_ENUM_ITEM_INDENT + json.dumps(country) + (',' if i < len(countries) - 1 else ''))
+    lines[enum_start:enum_end] = items
+
+    data = '\n'.join(lines)
+    json.loads(data) # should still be valid
+    return write_if_changed(manifest_path, data.encode('utf-8'))
+
+
+
+# Compares the city IDs with those of the previous run
+def report_changes(previous, current):
+    added = sorted(set(current) - set(previous), key=int)
+    removed = sorted(set(previous) - set(current), key=int)
+    renamed = sorted([city_id for city_id in current if city_id in previous and previous[city_id] != current[city_id]], key=int)
+
+    for city_id in added:
+        print("added:   " + city_id + " " + current[city_id])
+    for city_id in removed:
+        print("removed: " + city_id + " " + previous[city_id])
+    for city_id in renamed:
+        print("renamed: " + city_id + " " + previous[city_id] + " -> " + current[city_id])
+    print(str(len(added)) + " added, " + str(len(removed)) + " removed, " + str(len(renamed)) + " renamed")
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Creates the city data of the addon from wmo_full_city_list.csv")
+    parser.add_argument('--city-json', action='append', default=[], help="a WMO city file, or a directory with them, to add to city_metadata.json")
+    arguments = parser.parse_args()
+
+    metadata = {}
+    if os.path.isfile(METADATA_PATH):
+        with open(METADATA_PATH, 'r', encoding='utf-8') as file:
+            metadata = json.load(file)
+    enriched = enrich(metadata, arguments.city_json)
+
+    cities = read_cities()
+    countries = get_countries(cities)
+    for city in cities:
+        city.update(metadata.get(str(city['city_id']), {}))
+
+    table = pack_city_table(cities)
+    checksum = hashlib.sha256(table).hexdigest()
+
+    catalogue = {
+        'count': len(cities),
+        'checksum': checksum,
+        'cities': {},
+    }
+    for city in cities:
+        catalogue['cities'][str(city['city_id'])] = city['name']
+
+    fragment = {
+        'Country': {
+            'enum': countries,
+            'type': 'string',
+        },
+    }
+
+    previous = {}
+    if os.path.isfile(CATALOGUE_PATH):
+        with open(CATALOGUE_PATH, 'r', encoding='utf-8') as file:
+            previous = json.load(file).get('cities', {})
+
+    outputs = [
+        (TABLE_PATH, write_if_changed(TABLE_PATH, table)),
+        (FRAGMENT_PATH, write_if_changed(FRAGMENT_PATH, (json.dumps(fragment, indent=2, ensure_ascii=False) + '\n').encode('utf-8'))),
+        (CATALOGUE_PATH, write_if_changed(CATALOGUE_PATH, (json.dumps(catalogue, indent=1, sort_keys=True, ensure_ascii=False) + '\n').encode('utf-8'))),
+        (METADATA_PATH, write_if_changed(METADATA_PATH, (json.dumps(metadata, indent=1, sort_keys=True, ensure_ascii=False) + '\n').encode('utf-8'))),
+        (MANIFEST_PATH, update_manifest(countries)),
+    ]
+
+    print(str(len(cities)) + " cities in " + str(len(countries)) + " countries, checksum " + checksum)
+    print(str(len(metadata)) + " cities have metadata, " + str(enriched) + " of them were added or changed now")
+    for path, changed in outputs:
+        print(("updated:   " if changed else "unchanged: ") + os.path.normpath(path))
+    report_changes(previous, catalogue['cities'])
+
+
+
+if __name__ == '__main__':
+    main()
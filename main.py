@@ -20,6 +20,7 @@ print = functools.partial(print, flush=True)
 def cleanup(signum, frame):
     """Clean up any resources before exiting."""
     if _ADAPTER is not None:
+        _ADAPTER.unload()
         _ADAPTER.close_proxy()
 
     sys.exit(0)
@@ -7,17 +7,38 @@ sys.path.append(path.join(path.dirname(path.abspath(__file__)), 'lib'))
 
 import time
 from time import sleep
+import threading
 
+import re
 import json
+import concurrent.futures
 
 from gateway_addon import Adapter, Device, Property, Action, Database
 
 from .util import *
-
-import urllib.request
+from .present_stream import scan_present
+from .station_table import StationTable
+from .response_cache import ResponseCache
+from .http_client import ACCEPT_ENCODING, ConnectionPool, decoded_stream
+from .scheduler import Scheduler, AdaptivePoller
+from .weather_properties import TODAY_PROPERTIES, TOMORROW_PROPERTIES
 
 _TIMEOUT = 3
 
+_WMO_URL = 'https://worldweather.wmo.int/en/json/'
+
+# How long downloaded data may be used without asking the server again after a restart, in seconds.
+# Scheduled checks always ask the server, with a conditional request, so these do not delay them.
+_PRESENT_CACHE_TTL = 600
+_PREDICTION_CACHE_TTL = 3 * 3600
+
+# The prediction only changes a few times a day, so it is not checked more often than this
+_PREDICTION_INTERVAL = 3 * 3600
+_SNAPSHOT_INTERVAL = 300
+
+# Finds the issue date in a prediction file without parsing all of it
+_ISSUE_DATE_PATTERN = re.compile(rb'"issueDate"\s*:\s*"([^"]*)"')
+
 _CONFIG_PATHS = [
     os.path.join(os.path.expanduser('~'), '.webthings', 'config'),
 ]
@@ -43,346 +64,342 @@ class CandleWeatherAdapter(Adapter):
         #print("candle weather debug: Adapter ID = " + self.get_id())
 
         self.addon_path = os.path.join(self.user_profile['addonsDir'], self.addon_name)
+        self.data_path = os.path.join(self.user_profile['dataDir'], self.addon_name)
+        self.snapshot_path = os.path.join(self.data_path, 'snapshot.json')
 
         self.DEBUG = True
         self.first_request_done = False
         self.running = True
+        self.stop_event = threading.Event() # set when the addon is shutting down
+        self.snapshot_dirty = False
         
         self.interval = 3600 # 1 hour is 3600 seconds
+        self.adaptive_polling = False
+        self.issue_stamps = {} # ('present' or 'prediction', city code) -> the issue stamp of the latest data
+        self.pollers = {} # same keys -> AdaptivePoller
+        self.processed_issues = {} # same keys -> the issue stamp that the property values currently show
+        self.property_touches = 0 # property updates during the current refresh cycle
+        self.property_notifications = 0 # changed values sent to the gateway during the current refresh cycle
         
         self.metric = True
-        self.temperature_unit = 'degree celsius'
+        self.dead_bands = {} # property name -> (dead-band, hysteresis)
         
         self.nearest_city = "Netherlands - Amsterdam (Schiphol)"
-        self.nearest_city_code = 143 # Schiphol, NL
+        self.additional_cities = []
+        self.latitude = None # the location of the user, if it has been set
+        self.longitude = None
+        self.download_concurrency = 4 # how many downloads may be handled at the same time
         
         try:
             self.add_from_config()
         except Exception as ex:
             print("candle weather debug: Error loading config: " + str(ex))
 
-        self.nearest_city_code = get_city_code(self.nearest_city)
-        if self.DEBUG:
-            print("candle weather debug: self.nearest_city_code: " + str(self.nearest_city_code))
-            
-        
-        try:
-            candle_weather_device = CandleWeatherDevice(self)
-            self.handle_device_added(candle_weather_device)
-            self.devices['candle-weather-today'].connected = True
-            self.devices['candle-weather-today'].connected_notify(True)
-            self.thing = self.get_device("candle-weather-today")
-        except Exception as ex:
-            print("candle weather debug: Error creating thing: " + str(ex))
-            
-        self.tomorrow_thing = None
-
-
-        # test
-        hour_counter = 0
-        while self.running == True:
-            
-            if hour_counter == 0 or hour_counter > self.interval:
-                hour_counter = 0
-                if self.DEBUG:
-                    print("candle weather debug: grabbing fresh weather data")
-                self.download_data(self.nearest_city_code)
+        # Every city gets its own things
+        self.locations = []
+        for city_name in [self.nearest_city] + self.additional_cities:
+            try:
+                city_code = get_city_code(city_name)
+            except KeyError:
+                # The name may have been misspelled, or the city may have been renamed since it was selected.
+                # The weather of the wrong city would be misleading, so another city is only used if it is clearly the one that was meant.
+                match = match_city(city_name)
+                if match == None:
+                    suggestions = search_cities(city_name, 3)
+                    print("candle weather: Error, unknown city: " + str(city_name) + ". Did you mean: " + str([suggestion[0] for suggestion in suggestions]))
+                    continue
+                print("candle weather: unknown city: " + str(city_name) + ", using " + str(match) + " instead")
+                city_name = match
+                city_code = get_city_code(city_name)
+            if city_code in [location.city_code for location in self.locations]:
+                continue
+            location = WeatherLocation(city_name, city_code, len(self.locations) == 0)
+            # most cities only get a location once their prediction has been downloaded
+            city_location = get_city_location(city_name)
+            if self.latitude != None and self.longitude != None and city_location != None:
+                location.distance = distance_km(self.latitude, self.longitude, city_location[0], city_location[1])
+            self.locations.append(location)
+            if self.DEBUG:
+                print("candle weather debug: city code for " + str(city_name) + ": " + str(city_code))
             
-            hour_counter += 1
-            time.sleep(1)
+        # Remembers the ETag and Last-Modified headers of earlier downloads, so the WMO server can tell us nothing changed
+        self.response_cache = ResponseCache(os.path.join(self.data_path, 'http_cache'), debug=self.DEBUG)
+        self.processed_cache_keys = set() # responses that have already been turned into property values
+        
+        # All downloads go to the same server, so they share kept-alive connections.
+        # The pool never sends that server more than a fixed number of requests at once, however many downloads are handled at the same time.
+        self.http_pool = ConnectionPool(debug=self.DEBUG)
+        self.download_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.download_concurrency)
+        
+        # The things are created with all their properties
+        for location in self.locations:
+            try:
+                location.thing = CandleWeatherDevice(self, location)
+                location.tomorrow_thing = CandleTomorrowDevice(self, location)
+            except Exception as ex:
+                print("candle weather debug: Error creating thing: " + str(ex))
+        
+        # Show the values from before the restart right away, until fresh data has been downloaded
+        self.restore_snapshot()
+        
+        # A single announcement per thing, with its properties and restored values
+        for location in self.locations:
+            for thing in (location.thing, location.tomorrow_thing):
+                if thing != None:
+                    self.handle_device_added(thing)
+                    self.devices[thing.id].connected = True
+                    self.devices[thing.id].connected_notify(True)
+        
+        # The weather is refreshed in the background, so that the adapter is ready as soon as it has been created
+        self.scheduler = Scheduler(self.stop_event, debug=self.DEBUG)
+        self.scheduler.add_job('present', self.interval, self.refresh)
+        self.scheduler.add_job('prediction', max(self.interval, _PREDICTION_INTERVAL), self.refresh)
+        self.scheduler.add_job('snapshot', _SNAPSHOT_INTERVAL, self.flush_snapshot, _SNAPSHOT_INTERVAL)
+        self.refresh_thread = threading.Thread(target=self.refresh_loop, daemon=True)
+        self.refresh_thread.start()
 
         if self.DEBUG:
             print("candle weather debug: End of CandleWeatherAdapter init process")
         
 
 
-    def download_data(self, city_code):
+    def refresh_loop(self):
+        self.scheduler.run() # returns right away when the addon is unloaded
         
-        # get current weather
+        if self.DEBUG:
+            print("candle weather debug: refresh thread has stopped")
         
-        url = 'https://worldweather.wmo.int/en/json/present.xml'
-        response = urllib.request.urlopen(url)
-        data = response.read()      # a `bytes` object
-        text = data.decode('utf-8') # a `str`; this step can't be used if data is binary
-        current_data = json.loads(text)
-        if 'present' in current_data:
-            for x in current_data['present']:
-                #print(x)
-                if 'cityId' in current_data['present'][x]:
-                    
-                    if int(current_data['present'][x]['cityId']) == int(city_code):
-                        if self.DEBUG:
-                            print("candle weather debug: Found the city: " + str(current_data['present'][x]))
-                
-                        city_dict = current_data['present'][x]
-                
-                        """
-                        city['temp']
-                        city_dict['rh'] # rain
-                        city_dict['sunrise'] # time
-                        city_dict['sunset'] # time
-                        city_dict['wd'] # wind direction
-                        city_dict['ws'] # wind speed
-                        city_dict['wxdesc'] # description, e.g. "Mist"
-                        """
-                
-                
-                        # Location
-                        targetProperty = self.thing.find_property('location')
-                        if targetProperty == None:
-                            if self.DEBUG:
-                                print("candle weather debug: -Location property did not exist yet. Creating it now.")
-                            self.thing.properties["location"] = CandleWeatherProperty(
-                                            self.thing,
-                                            "location",
-                                            {
-                                                "label": "Location",
-                                                'type': 'string',
-                                                'readOnly': True,
-                                            },
-                                            str(self.nearest_city))
-                            
-                            self.handle_device_added(self.thing)
-                            targetProperty = self.thing.find_property('location')
 
-                        targetProperty.update(str(self.nearest_city))
-                
-                
-                        # todays weather description
-                        targetProperty = self.thing.find_property('current_description')
-                        if targetProperty == None:
-                            if self.DEBUG:
-                                print("candle weather debug: -Today's current description property did not exist yet. Creating it now.")
-                            self.thing.properties["current_description"] = CandleWeatherProperty(
-                                            self.thing,
-                                            "current_description",
-                                            {
-                                                "label": "Description",
-                                                'type': 'string',
-                                                'readOnly': True,
-                                            },
-                                            str(city_dict['wxdesc']))
-                            
-                            self.handle_device_added(self.thing)
-                            targetProperty = self.thing.find_property('current_description')
 
-                        targetProperty.update(str(city_dict['wxdesc']))
-                
-                
-                        # todays humidity
-                        targetProperty = self.thing.find_property('current_humidity')
-                        if targetProperty == None:
-                            if self.DEBUG:
-                                print("candle weather debug: -Today's current humidity property did not exist yet. Creating it now.")
-                            self.thing.properties["current_humidity"] = CandleWeatherProperty(
-                                            self.thing,
-                                            "current_humidity",
-                                            {
-                                                "label": "Humidity",
-                                                'type': 'integer',
-                                                'unit': 'percent',
-                                                'readOnly': True,
-                                                'multipleOf':1,
-                                            },
-                                            round(float(city_dict['rh'])))
-                                            
-                            self.handle_device_added(self.thing)
-                            targetProperty = self.thing.find_property('current_humidity')
-
-                        targetProperty.update(round(float(city_dict['rh'])))
-                        
-                        
-                        # todays wind direction
-                        targetProperty = self.thing.find_property('current_wind_direction')
-                        if targetProperty == None:
-                            if self.DEBUG:
-                                print("candle weather debug: -Today's current wind direction property did not exist yet. Creating it now.")
-                            self.thing.properties["current_wind_direction"] = CandleWeatherProperty(
-                                            self.thing,
-                                            "current_wind_direction",
-                                            {
-                                                "label": "Wind direction",
-                                                'type': 'string',
-                                                'readOnly': True,
-                                            },
-                                            get_long_compass(city_dict['wd']))
-                            
-                            self.handle_device_added(self.thing)
-                            targetProperty = self.thing.find_property('current_wind_direction')
+    # Called by the scheduler with the jobs that are due: 'present', 'prediction' or both
+    def refresh(self, jobs):
+        if self.DEBUG:
+            print("candle weather debug: grabbing fresh weather data")
+        
+        # Changed values are sent to the gateway together once the whole cycle is done,
+        # so the things never show a mix of old and new data
+        things = self.things()
+        for thing in things:
+            thing.begin_batch()
+        try:
+            self.download_data('present' in jobs, 'prediction' in jobs)
+        finally:
+            # the next cycle is minutes away, and the server will have closed the connections by then
+            self.http_pool.close_idle(everything=True)
+            self.property_notifications = 0
+            for thing in things:
+                self.property_notifications += thing.flush_batch()
+        if self.DEBUG:
+            print("candle weather debug: property changes sent to the gateway: " + str(self.property_notifications))
+        
+        if self.adaptive_polling:
+            # plan the next check for just after the WMO is expected to publish new data for one of the cities
+            delays = {}
+            for job in jobs:
+                for location in self.locations:
+                    key = (job, location.city_code)
+                    if not key in self.pollers:
+                        self.pollers[key] = AdaptivePoller(self.scheduler.jobs[job]['period'])
+                    delay = self.pollers[key].observe(self.issue_stamps.get(key))
+                    if not job in delays or delay < delays[job]:
+                        delays[job] = delay
+                if self.DEBUG:
+                    print("candle weather debug: adaptive polling: next " + str(job) + " check in " + str(round(delays[job])) + " seconds")
+            return delays
+        
+
+
+    def things(self):
+        things = []
+        for location in self.locations:
+            for thing in (location.thing, location.tomorrow_thing):
+                if thing != None:
+                    things.append(thing)
+        return things
+        
+
+
+    def flush_snapshot(self, jobs=None):
+        if self.snapshot_dirty:
+            self.snapshot_dirty = False
+            self.save_snapshot()
+        
+
+
+    def download_data(self, current=True, prediction=True):
+        
+        self.property_touches = 0
+        
+        # The current weather and the predictions are downloaded at the same time.
+        # The current weather of all cities comes from a single download, each city has its own prediction file.
+        # Property values are updated here, in this thread, as soon as a download has arrived.
+        # The current weather is submitted first, so it never waits for the predictions
+        futures = {}
+        if current:
+            city_codes = [location.city_code for location in self.locations]
+            futures[self.download_pool.submit(self.download_current_weather, city_codes)] = (self.apply_current_weather, self.locations)
+        if prediction:
+            for location in self.locations:
+                futures[self.download_pool.submit(self.download_prediction, location.city_code)] = (self.apply_prediction, [location])
+        applied = False
+        failed_locations = []
+        for future in concurrent.futures.as_completed(futures):
+            apply_function, locations = futures[future]
+            try:
+                cache_key, data = future.result()
+            except Exception as ex:
+                if self.stop_event.is_set():
+                    return # the download was interrupted because the addon is shutting down
+                print("candle weather debug: Error downloading weather data: " + str(ex))
+                failed_locations += locations
+                continue
+            if data == None:
+                continue
+            for location in locations:
+                try:
+                    apply_function(location, cache_key, data)
+                    applied = True
+                except Exception as ex:
+                    print("candle weather debug: Error updating weather data for " + str(location.name) + ": " + str(ex))
+                    failed_locations.append(location)
+        
+        self.set_stale(False, [location for location in self.locations if not location in failed_locations])
+        self.first_request_done = True # from now on the cache is only used when the server says nothing changed
+        if applied:
+            self.snapshot_dirty = True
+        
+        if self.DEBUG:
+            print("candle weather debug: Weather update should be complete, properties touched: " + str(self.property_touches))
+            print("candle weather debug: connection stats: " + str(self.http_pool.stats()))
+            print("candle weather debug: cache stats: " + str(self.response_cache.stats()))
+        
+        
+        
+    # get current weather for all cities at once. Returns the cache key and the records by cityId, or None as the records if nothing changed.
+    def download_current_weather(self, city_codes):
+        url = _WMO_URL + 'present.xml'
+        # only the records for our cities are remembered, as a StationTable, not the whole feed
+        cache_key = url + '#stations=' + ','.join(sorted(str(city_code) for city_code in city_codes))
+        present_records = None
+        response = None
+        cached_body = None
+        if self.first_request_done == False:
+            cached_body = self.response_cache.get_fresh(cache_key)
+        if cached_body == None:
+            response = self.open_url(url, cache_key)
+            if response == None:
+                self.response_cache.touch(cache_key, _PRESENT_CACHE_TTL)
+                cached_body = self.response_cache.load(cache_key)
+        elif self.DEBUG:
+            print("candle weather debug: using cached current weather")
+            
+        if response != None:
+            present_records = {}
+            station_table = StationTable()
+            try:
+                # only the records of the cities we track are decoded, and reading stops once they have all been found
+                for record in scan_present(response, city_codes):
+                    present_records[int(record['cityId'])] = record
+                    station_table.add(record)
+            finally:
+                response.close()
+            self.response_cache.store(cache_key, station_table.to_json(), response.headers, _PRESENT_CACHE_TTL)
+            
+        elif cached_body != None and not cache_key in self.processed_cache_keys:
+            # Not modified, but the values have not been shown since the addon started
+            present_records = StationTable.from_json(cached_body).records(city_codes)
 
-                        targetProperty.update(get_long_compass(city_dict['wd']))
-                
-                
-                        # todays wind speed
-                        targetProperty = self.thing.find_property('current_wind_speed')
-                        if targetProperty == None:
-                            if self.DEBUG:
-                                print("candle weather debug: -Today's current wind_speed property did not exist yet. Creating it now.")
-                            self.thing.properties["current_wind_speed"] = CandleWeatherProperty(
-                                            self.thing,
-                                            "current_wind_speed",
-                                            {
-                                                "label": "Wind speed",
-                                                'type': 'number',
-                                                'readOnly': True,
-                                                'multipleOf':0.1,
-                                            },
-                                            float(city_dict['ws']))
-                                            
-                            self.handle_device_added(self.thing)
-                            targetProperty = self.thing.find_property('current_wind_speed')
-
-                        targetProperty.update(float(city_dict['ws']))
-                        
+        if present_records == None:
+            if self.DEBUG:
+                print("candle weather debug: current weather has not changed since the last download")
+        return cache_key, present_records
+        
+        
+        
+    def apply_current_weather(self, location, cache_key, present_records):
+        if int(location.city_code) in present_records:
+            city_dict = present_records[int(location.city_code)]
+            issue = city_dict.get('issue')
+            self.issue_stamps[('present', location.city_code)] = issue
+            if issue and self.processed_issues.get(('present', location.city_code)) == issue:
+                if self.DEBUG:
+                    print("candle weather debug: current weather for " + str(location.name) + " has not changed since " + str(issue))
+                return
+            if self.DEBUG:
+                print("candle weather debug: Found the city: " + str(city_dict))
                 
-                        if 'sunrise' in city_dict:
-                            if ":" in city_dict['sunrise']:
-                                time_parts = city_dict['sunrise'].split(":")
-                            
-                                # sunrise hour
-                                targetProperty = self.thing.find_property('current_sunrise_hour')
-                                if targetProperty == None:
-                                    if self.DEBUG:
-                                        print("candle weather debug: -Today's current sunrise hour property did not exist yet. Creating it now.")
-                                    self.thing.properties["current_sunrise_hour"] = CandleWeatherProperty(
-                                                    self.thing,
-                                                    "current_sunrise_hour",
-                                                    {
-                                                        "label": "Sunrise hour",
-                                                        'type': 'integer',
-                                                        'readOnly': True,
-                                                        'multipleOf':1,
-                                                    },
-                                                    int(time_parts[0]))
-                                            
-                                    self.handle_device_added(self.thing)
-                                    targetProperty = self.thing.find_property('current_sunrise_hour')
-
-                                targetProperty.update(int(time_parts[0]))
-                            
-                                # sunrise minutes
-                                targetProperty = self.thing.find_property('current_sunrise_minute')
-                                if targetProperty == None:
-                                    if self.DEBUG:
-                                        print("candle weather debug: -Today's current sunrise minute property did not exist yet. Creating it now.")
-                                    self.thing.properties["current_sunrise_minute"] = CandleWeatherProperty(
-                                                    self.thing,
-                                                    "current_sunrise_minute",
-                                                    {
-                                                        "label": "Sunrise minute",
-                                                        'type': 'integer',
-                                                        'readOnly': True,
-                                                        'multipleOf':1,
-                                                    },
-                                                    int(time_parts[1]))
-                                            
-                                    self.handle_device_added(self.thing)
-                                    targetProperty = self.thing.find_property('current_sunrise_minute')
-
-                                targetProperty.update(int(time_parts[1]))
-                            
-                        
-                        if 'sunset' in city_dict:
-                            if ":" in city_dict['sunset']:
-                                time_parts = city_dict['sunset'].split(":")
-                            
-                                # sunset hour
-                                targetProperty = self.thing.find_property('current_sunset_hour')
-                                if targetProperty == None:
-                                    if self.DEBUG:
-                                        print("candle weather debug: -Today's current sunset hour property did not exist yet. Creating it now.")
-                                    self.thing.properties["current_sunset_hour"] = CandleWeatherProperty(
-                                                    self.thing,
-                                                    "current_sunset_hour",
-                                                    {
-                                                        "label": "Sunset hour",
-                                                        'type': 'integer',
-                                                        'readOnly': True,
-                                                        'multipleOf':1,
-                                                    },
-                                                    int(time_parts[0]))
-                                            
-                                    self.handle_device_added(self.thing)
-                                    targetProperty = self.thing.find_property('current_sunset_hour')
-
-                                targetProperty.update(int(time_parts[0]))
-                            
-                                # sunset minutes
-                                targetProperty = self.thing.find_property('current_sunset_minute')
-                                if targetProperty == None:
-                                    if self.DEBUG:
-                                        print("candle weather debug: -Today's current sunset minute property did not exist yet. Creating it now.")
-                                    self.thing.properties["current_sunset_minute"] = CandleWeatherProperty(
-                                                    self.thing,
-                                                    "current_sunset_minute",
-                                                    {
-                                                        "label": "Sunset minute",
-                                                        'type': 'integer',
-                                                        'readOnly': True,
-                                                        'multipleOf':1,
-                                                    },
-                                                    int(time_parts[1]))
-                                            
-                                    self.handle_device_added(self.thing)
-                                    targetProperty = self.thing.find_property('current_sunset_minute')
-
-                                targetProperty.update(int(time_parts[1]))
-                            
-                            
-                        # todays temperature
-                        
-                        current_temp = float(city_dict['temp'])
-                        if self.metric == False:
-                            current_temp = round((current_temp * 1.8) + 32 ,1) # convert to Fahrenheit
-                        
-                        targetProperty = self.thing.find_property('temperature')
-                        if targetProperty == None:
-                            if self.DEBUG:
-                                print("candle weather debug: -Today's current temperature property did not exist yet. Creating it now.")
-                            self.thing.properties["temperature"] = CandleWeatherProperty(
-                                            self.thing,
-                                            "temperature",
-                                            {
-                                                "@type": "TemperatureProperty",
-                                                "label": "Temperature",
-                                                'type': 'number',
-                                                'unit': self.temperature_unit,
-                                                'readOnly': True,
-                                                'multipleOf':0.1,
-                                            },
-                                            current_temp)
-
-                            self.handle_device_added(self.thing)
-
-                            targetProperty = self.thing.find_property('temperature')
+            location.thing.update_properties('present', city_dict)
             
-                        targetProperty.update(current_temp)
+            self.processed_cache_keys.add(cache_key)
+            self.processed_issues[('present', location.city_code)] = issue
                             
-                        break
-        
-                else:
-                    if self.DEBUG:
-                        print("candle weather debug: \nno cityId in city: " + str(city_dict))
         else:
             if self.DEBUG:
-                print("candle weather debug: Error, 'present' was not found in current weather data")
-        
+                print("candle weather debug: Error, " + str(location.name) + " was not found in the current weather data")
+        
+        
+        
+    # get weather predictions. Returns the cache key and the parsed data, or None as the data if nothing changed.
+    def download_prediction(self, city_code):
+        url = _WMO_URL + str(city_code) + '_en.json'
+        response = None
+        data = None
+        if self.first_request_done == False:
+            data = self.response_cache.get_fresh(url)
+        if data == None:
+            response = self.open_url(url, url)
+            if response == None:
+                self.response_cache.touch(url, _PREDICTION_CACHE_TTL)
+                data = self.response_cache.load(url)
+        elif self.DEBUG:
+            print("candle weather debug: using cached weather prediction")
+            
+        if response != None:
+            try:
+                data = response.read()      # a `bytes` object
+            finally:
+                response.close()
+            self.response_cache.store(url, data, response.headers, _PREDICTION_CACHE_TTL)
+        elif url in self.processed_cache_keys:
+            data = None
+            
+        if data == None:
+            if self.DEBUG:
+                print("candle weather debug: weather prediction has not changed since the last download")
+            return url, None
+            
+        # A new download with the same issue date as the one that is shown already does not need to be parsed
+        match = _ISSUE_DATE_PATTERN.search(data)
+        if match != None:
+            issue = match.group(1).decode('utf-8')
+            self.issue_stamps[('prediction', city_code)] = issue
+            if issue and self.processed_issues.get(('prediction', city_code)) == issue:
+                if self.DEBUG:
+                    print("candle weather debug: weather prediction for " + str(city_code) + " has not changed since " + str(issue))
+                return url, None
+            
+        text = data.decode('utf-8') # a `str`; this step can't be used if data is binary
+        return url, json.loads(text)
         
         
-        # get weather predictions
         
-        url = 'https://worldweather.wmo.int/en/json/' + str(city_code) + '_en.json'
-        response = urllib.request.urlopen(url)
-        data = response.read()      # a `bytes` object
-        text = data.decode('utf-8') # a `str`; this step can't be used if data is binary
-        prediction_data = json.loads(text)
+    def apply_prediction(self, location, cache_key, prediction_data):
         if self.DEBUG:
             print("candle weather debug: DOWNLOADED PREDICTION JSON: " + str(prediction_data))
 
         if 'city' in prediction_data:
             
+            self.update_distance(location, prediction_data['city'])
+            
             if 'forecast' in prediction_data['city']:
                 
+                issue = prediction_data['city']['forecast'].get('issueDate')
+                self.issue_stamps[('prediction', location.city_code)] = issue
+                if issue and self.processed_issues.get(('prediction', location.city_code)) == issue:
+                    if self.DEBUG:
+                        print("candle weather debug: weather prediction for " + str(location.name) + " has not changed since " + str(issue))
+                    return
+                
                 if 'forecastDay' in prediction_data['city']['forecast']:
                     
                     if len(prediction_data['city']['forecast']['forecastDay']) > 0:
@@ -393,221 +410,15 @@ class CandleWeatherAdapter(Adapter):
                         if self.DEBUG:
                             print("candle weather debug: prediction days available: " + str(len(days_list)))
         
-                        # today prediction
-                        today_weather_string = days_list[0]['weather']
-                        today_minimum_temperature = float(days_list[0]['minTemp'])
-                        today_maximum_temperature = float(days_list[0]['maxTemp'])
-
-                        if self.metric == False:
-                            today_minimum_temperature = float(days_list[0]['minTempF'])
-                            today_maximum_temperature = float(days_list[0]['maxTempF'])
-
-                        #today_added = today_minimum_temperature + today_maximum_temperature
-                        #today_median_temperature = round( today_added * 2 ) / 2
-
-                        # TODAY
-        
-                        # todays minimum temperature
-                        targetProperty = self.thing.find_property('minimum_temperature')
-                        if targetProperty == None:
-                            if self.DEBUG:
-                                print("candle weather debug: -today's minimum property did not exist yet. Creating it now.")
-                            self.thing.properties["minimum_temperature"] = CandleWeatherProperty(
-                                            self.thing,
-                                            "minimum_temperature",
-                                            {
-                                                "label": "Minimum temperature",
-                                                'type': 'number',
-                                                'unit': self.temperature_unit,
-                                                'readOnly': True,
-                                                'multipleOf':0.1,
-                                            },
-                                            today_minimum_temperature)
-
-                            self.handle_device_added(self.thing)
-                            targetProperty = self.thing.find_property('minimum_temperature')
-            
-                        targetProperty.update(today_minimum_temperature)
-        
-        
-                        # todays maximum temperature
-                        targetProperty = self.thing.find_property('maximum_temperature')
-                        if targetProperty == None:
-                            if self.DEBUG:
-                                print("candle weather debug: -today's maximum property did not exist yet. Creating it now.")
-                            self.thing.properties["maximum_temperature"] = CandleWeatherProperty(
-                                            self.thing,
-                                            "maximum_temperature",
-                                            {
-                                                "label": "Maximum temperature",
-                                                'type': 'number',
-                                                'unit': self.temperature_unit,
-                                                'readOnly': True,
-                                                'multipleOf':0.1,
-                                            },
-                                            today_maximum_temperature)
-                            
-                            self.handle_device_added(self.thing)
-                            targetProperty = self.thing.find_property('maximum_temperature')
-            
-                        targetProperty.update(today_maximum_temperature)
-
-
-                        today_weather = "..."
-                        if days_list[0]['weather'] != "":
-                            today_weather = days_list[1]['weather']
-        
-                        # today's weather
-                        targetProperty = self.thing.find_property('description')
-                        if targetProperty == None:
-                            if self.DEBUG:
-                                print("candle weather debug: -today's weather property did not exist yet. Creating it now.")
-                            self.thing.properties["description"] = CandleWeatherProperty(
-                                            self.thing,
-                                            "description",
-                                            {
-                                                "label": "Weather today",
-                                                'type': 'string',
-                                                'readOnly': True
-                                            },
-                                            today_weather)
-
-                            self.handle_device_added(self.thing)
-                            targetProperty = self.thing.find_property('description')
-        
-                        targetProperty.update(today_weather)
-
-
-                        #print("candle weather debug: predicted days: " + str(len(prediction_data['city']['forecast']['forecastDay'])))
-
-                        if len(prediction_data['city']['forecast']['forecastDay']) > 1:
-                            
-                            
-                            try:
-                                if self.tomorrow_thing == None:
-                                    candle_tomorrow_device = CandleTomorrowDevice(self)
-                                    self.handle_device_added(candle_tomorrow_device)
-                                    self.devices['candle-weather-tomorrow'].connected = True
-                                    self.devices['candle-weather-tomorrow'].connected_notify(True)
-                                    self.tomorrow_thing = self.get_device("candle-weather-tomorrow")
-                            except Exception as ex:
-                                if self.DEBUG:
-                                    print("candle weather debug: Error creating tomorrow thing: " + str(ex))
-                            
-                            if self.tomorrow_thing:
-                                
-                                # Tomorrow Location
-                                targetProperty = self.tomorrow_thing.find_property('location')
-                                if targetProperty == None:
-                                    if self.DEBUG:
-                                        print("candle weather debug: -Location property did not exist yet. Creating it now.")
-                                    self.tomorrow_thing.properties["location"] = CandleWeatherProperty(
-                                                    self.tomorrow_thing,
-                                                    "location",
-                                                    {
-                                                        "label": "Location",
-                                                        'type': 'string',
-                                                        'readOnly': True,
-                                                    },
-                                                    str(self.nearest_city))
-                            
-                                    self.handle_device_added(self.tomorrow_thing)
-                                    targetProperty = self.tomorrow_thing.find_property('location')
-
-                                targetProperty.update(str(self.nearest_city))
-                            
-                                # TOMORROW
-                            
-                                # tomorrow prediction
-                                tomorrow_weather_string = days_list[1]['weather']
-                                tomorrow_minimum_temperature = float(days_list[1]['minTemp'])
-                                tomorrow_maximum_temperature = float(days_list[1]['maxTemp'])
-                            
-                                if self.metric == False:
-                                    tomorrow_minimum_temperature = float(days_list[1]['minTempF'])
-                                    tomorrow_maximum_temperature = float(days_list[1]['maxTempF'])
-        
-                                #tomorrow_added = tomorrow_minimum_temperature + tomorrow_maximum_temperature
-                                #tomorrow_median_temperature = round( tomorrow_added * 2 ) / 2
-                            
-                                tomorrow_weather = "..."
-                                if days_list[1]['weather'] != "":
-                                    tomorrow_weather = days_list[1]['weather']
-            
-                                # tomorrows weather
-                                targetProperty = self.tomorrow_thing.find_property('weather')
-                                if targetProperty == None:
-                                    if self.DEBUG:
-                                        print("candle weather debug: -tomorrow's weather property did not exist yet. Creating it now.")
-                                    self.tomorrow_thing.properties["weather"] = CandleWeatherProperty(
-                                                    self.tomorrow_thing,
-                                                    "weather",
-                                                    {
-                                                        "label": "Weather tomorrow",
-                                                        'type': 'string',
-                                                        'readOnly': True
-                                                    },
-                                                    tomorrow_weather)
-
-                                    self.handle_device_added(self.tomorrow_thing)
-                                    targetProperty = self.tomorrow_thing.find_property('weather')
-            
-                                targetProperty.update(tomorrow_weather)
-                            
-            
-                                # tomorrows minimum temperature
-                                targetProperty = self.tomorrow_thing.find_property('minimum_temperature')
-                                if targetProperty == None:
-                                    if self.DEBUG:
-                                        print("candle weather debug: -tomorrow's minimum temperature property did not exist yet. Creating it now.")
-                                    self.tomorrow_thing.properties["minimum_temperature"] = CandleWeatherProperty(
-                                                    self.tomorrow_thing,
-                                                    "minimum_temperature",
-                                                    {
-                                                        "label": "Minimum temperature",
-                                                        'type': 'number',
-                                                        'unit': self.temperature_unit,
-                                                        'readOnly': True,
-                                                        'multipleOf':0.1,
-                                                    },
-                                                    tomorrow_minimum_temperature)
-
-                                    self.handle_device_added(self.tomorrow_thing)
-                                    targetProperty = self.tomorrow_thing.find_property('minimum_temperature')
-            
-                                targetProperty.update(tomorrow_minimum_temperature)
-        
-        
-                                # tomorrows maximum temperature
-                                targetProperty = self.tomorrow_thing.find_property('maximum_temperature')
-                                if targetProperty == None:
-                                    if self.DEBUG:
-                                        print("candle weather debug: -tomorrow's maximum temperature property did not exist yet. Creating it now.")
-                                    self.tomorrow_thing.properties["maximum_temperature"] = CandleWeatherProperty(
-                                                    self.tomorrow_thing,
-                                                    "maximum_temperature",
-                                                    {
-                                                        "@type": "TemperatureProperty",
-                                                        "label": "Maximum temperature",
-                                                        'type': 'number',
-                                                        'unit': self.temperature_unit,
-                                                        'readOnly': True,
-                                                        'multipleOf':0.1,
-                                                    },
-                                                    tomorrow_maximum_temperature)
-                                                
-                                    self.handle_device_added(self.tomorrow_thing)
-                                    targetProperty = self.tomorrow_thing.find_property('maximum_temperature')
-            
-                                targetProperty.update(tomorrow_maximum_temperature)
-                                
-                            else:
-                                if self.DEBUG:
-                                    print("candle weather debug: \nError, tomorrow_thing failed to be created?")
-                                    
+                        location.thing.update_properties('prediction', days_list)
+                        
+                        if len(days_list) > 1:
+                            location.tomorrow_thing.update_properties('prediction', days_list)
                         else:
                             if self.DEBUG:
                                 print("candle weather debug: \nNo prediction data for tomorrow available")
+                        
+                        self.processed_issues[('prediction', location.city_code)] = issue
                             
                     else:
                         if self.DEBUG:
@@ -625,17 +436,129 @@ class CandleWeatherAdapter(Adapter):
             if self.DEBUG:
                 print("candle weather debug: 'nError, city key missing in prediction data: " + str(prediction_data))
         
-        if self.DEBUG:
-            print("candle weather debug: Weather update should be complete")
-        
+        self.processed_cache_keys.add(cache_key)
         
-                
         
         
 
+    # The prediction file tells where the weather station of the city is
+    def update_distance(self, location, city_dict):
+        if self.latitude == None or self.longitude == None:
+            return
+        city_location = read_city_location(city_dict)
+        if city_location == None:
+            return
+        location.distance = distance_km(self.latitude, self.longitude, city_location[0], city_location[1])
+        location.thing.update_properties('distance', location)
+
+
+
+    # Saves the current property values, so they can be shown immediately after a restart
+    def save_snapshot(self):
+        try:
+            snapshot = {
+                'metric': self.metric,
+                'things': {},
+            }
+            for location in self.locations:
+                for thing in (location.thing, location.tomorrow_thing):
+                    if thing == None:
+                        continue
+                    properties = {}
+                    for name in thing.properties:
+                        if name == 'stale':
+                            continue
+                        properties[name] = {
+                            'value': thing.properties[name].value,
+                        }
+                    snapshot['things'][thing.id] = {
+                        'city': location.name,
+                        'properties': properties,
+                    }
+                
+            write_atomic(self.snapshot_path, json.dumps(snapshot).encode('utf-8'))
+        except Exception as ex:
+            print("candle weather debug: Error saving snapshot: " + str(ex))
+
+
+
+    def restore_snapshot(self):
+        try:
+            if not os.path.isfile(self.snapshot_path):
+                return
+            with open(self.snapshot_path) as f:
+                snapshot = json.load(f)
+                
+            # Values in other units would be misleading
+            if snapshot.get('metric') != self.metric:
+                if self.DEBUG:
+                    print("candle weather debug: settings have changed, not restoring the snapshot")
+                return
+                
+            for location in self.locations:
+                for thing_id in (location.today_id, location.tomorrow_id):
+                    saved_thing = snapshot['things'].get(thing_id)
+                    # the same thing may now show the weather of another city
+                    if saved_thing == None or saved_thing.get('city') != location.name:
+                        continue
+                    thing = location.thing
+                    if thing_id == location.tomorrow_id:
+                        thing = location.tomorrow_thing
+                    if thing == None:
+                        continue
+                    properties = saved_thing['properties']
+                    for name in properties:
+                        if name in thing.properties and properties[name]['value'] != None:
+                            thing.properties[name].set_initial_value(properties[name]['value'])
+                    thing.stale_property.set_initial_value(True)
+                    
+            if self.DEBUG:
+                print("candle weather debug: restored the snapshot of the last known weather")
+        except Exception as ex:
+            print("candle weather debug: Error restoring snapshot: " + str(ex))
+
+
+
+    # Tells whether the values are left over from before a restart (and no fresh data could be downloaded yet)
+    def set_stale(self, stale, locations=None):
+        if locations == None:
+            locations = self.locations
+        for location in locations:
+            for thing in (location.thing, location.tomorrow_thing):
+                if thing != None and thing.stale_property.value != stale:
+                    thing.update_properties('status', stale)
+
+
+
+    # Returns None if the server replied that the cached copy is still up to date (304 Not Modified).
+    # Compressed responses are decompressed while they are being read.
+    def open_url(self, url, cache_key):
+        headers = self.response_cache.conditional_headers(cache_key)
+        headers['Accept-Encoding'] = ACCEPT_ENCODING
+        response = self.http_pool.request(url, headers)
+        if response.status == 304:
+            response.close()
+            if self.DEBUG:
+                print("candle weather debug: not modified: " + str(url))
+            return None
+        if response.status != 200:
+            response.close()
+            raise Exception("HTTP error " + str(response.status) + " while downloading " + str(url))
+        return decoded_stream(response)
+
+
+
     def unload(self):
+        if self.running == False:
+            return
         print("candle weather debug: Shutting down CandleWeather")
         self.running = False
+        self.stop_event.set()
+        self.download_pool.shutdown(wait=False, cancel_futures=True)
+        # interrupts downloads that are still in progress
+        self.http_pool.close_all()
+        self.refresh_thread.join(0.5)
+        self.flush_snapshot()
         
 
 
@@ -664,6 +587,13 @@ class CandleWeatherAdapter(Adapter):
                 return
 
             config = database.load_config()
+            if config and migrate_city_config(config):
+                # the old choice is still used if saving fails, as the config in memory has been changed already
+                try:
+                    database.save_config(config)
+                    print("candle weather: moved the nearest city from the old settings to the country and city settings")
+                except Exception as ex:
+                    print("candle weather: Error saving the migrated settings: " + str(ex))
             database.close()
         except:
             print("candle weather debug: Error! Failed to open settings database.")
@@ -686,10 +616,11 @@ class CandleWeatherAdapter(Adapter):
             print("candle weather: Error loading debugging preference")
             
         
-        # Nearest city from dropdown
+        # Nearest city, from the country dropdown and the city name
         try:
-            if 'Nearest city' in config:
-                self.nearest_city = str(config['Nearest city'])
+            city_name = get_configured_city(config)
+            if city_name != None:
+                self.nearest_city = city_name
                 if self.DEBUG:
                     print("candle weather debug: selected nearest city: " + str(self.nearest_city))
             else:
@@ -701,12 +632,41 @@ class CandleWeatherAdapter(Adapter):
                 print("candle weather: Error with nearest city selection: " + str(ex))
             
         
+        # Latitude and longitude, to show how far away the weather station of each city is
+        try:
+            if 'Latitude' in config and 'Longitude' in config and config['Latitude'] != None and config['Longitude'] != None:
+                latitude = float(config['Latitude'])
+                longitude = float(config['Longitude'])
+                if -90 <= latitude <= 90 and -180 <= longitude <= 180:
+                    self.latitude = latitude
+                    self.longitude = longitude
+                    if self.DEBUG:
+                        print("candle weather debug: location: " + str(self.latitude) + ", " + str(self.longitude))
+                else:
+                    print("candle weather: Error, latitude or longitude is out of range")
+        except Exception as ex:
+            if self.DEBUG:
+                print("candle weather: Error with latitude and longitude: " + str(ex))
+            
+        
+        # Additional cities, which each get their own things
+        try:
+            if 'Additional cities' in config:
+                self.additional_cities = []
+                for city_name in config['Additional cities']:
+                    if str(city_name).strip() != '':
+                        self.additional_cities.append(str(city_name).strip())
+                if self.DEBUG:
+                    print("candle weather debug: additional cities: " + str(self.additional_cities))
+        except Exception as ex:
+            if self.DEBUG:
+                print("candle weather: Error with additional cities: " + str(ex))
+            
+        
         # Metric or Imperial
         try:
             if 'Metric' in config:
                 self.metric = bool(config['Metric'])
-                if self.metric == False:
-                    self.temperature_unit = 'degree fahrenheit'
             else:
                 if self.DEBUG:
                     print("candle weather debug: metric preference was not in config")
@@ -725,66 +685,197 @@ class CandleWeatherAdapter(Adapter):
         except Exception as ex:
             if self.DEBUG:
                 print("candle weather debug: Update prequency preference not found error: " + str(ex))
+        
+        
+        # Parallel downloads
+        try:
+            if 'Parallel downloads' in config:
+                self.download_concurrency = min(max(int(config['Parallel downloads']), 1), 8)
+                if self.DEBUG:
+                    print("candle weather debug: Parallel downloads is set to: " + str(self.download_concurrency))
+        except Exception as ex:
+            if self.DEBUG:
+                print("candle weather debug: Parallel downloads preference error: " + str(ex))
+        
+        
+        # Adaptive polling
+        try:
+            if 'Adaptive polling' in config:
+                self.adaptive_polling = bool(config['Adaptive polling'])
+                if self.DEBUG:
+                    print("candle weather debug: Adaptive polling is set to: " + str(self.adaptive_polling))
+        except Exception as ex:
+            if self.DEBUG:
+                print("candle weather debug: Adaptive polling preference error: " + str(ex))
+        
+        
+        # Dead-bands
+        try:
+            if 'Dead-bands' in config:
+                for item in config['Dead-bands']:
+                    if not 'Property' in item:
+                        continue
+                    dead_band = max(0.0, float(item.get('Dead-band', 0)))
+                    hysteresis = max(0.0, float(item.get('Hysteresis', 0)))
+                    self.dead_bands[str(item['Property'])] = (dead_band, hysteresis)
+                if self.DEBUG:
+                    print("candle weather debug: Dead-bands are set to: " + str(self.dead_bands))
+        except Exception as ex:
+            if self.DEBUG:
+                print("candle weather debug: Dead-bands preference error: " + str(ex))
+
+
+#
+#  LOCATION
+#
+
+class WeatherLocation():
+    """A city the weather is shown for, and its things."""
+
+    def __init__(self, name, city_code, primary):
+        self.name = name
+        self.city_code = city_code
+        self.distance = None # kilometers between the user and the city, if both locations are known
+        self.thing = None
+        self.tomorrow_thing = None
+        
+        # The first city keeps the thing IDs from before there could be more than one city
+        if primary:
+            self.today_id = 'candle-weather-today'
+            self.tomorrow_id = 'candle-weather-tomorrow'
+            self.title_suffix = ''
+        else:
+            self.today_id = 'candle-weather-today-' + str(city_code)
+            self.tomorrow_id = 'candle-weather-tomorrow-' + str(city_code)
+            self.title_suffix = ' - ' + str(name).split(' - ', 1)[-1]
+
 
 
 #
 #  DEVICES
 #
 
-class CandleWeatherDevice(Device):
+class CandleDevice(Device):
+    """Base class of the weather things. Their properties are created from a list of property specifications."""
+
+    def create_properties(self, specs, location):
+        self.specs = specs
+        self.batch = None # property -> new value, while a batch is open
+        self.handles = {} # feed -> list of (extractor, property), so updates do not have to look anything up
+        initial_data = {
+            'location': location,
+            'distance': location,
+            'status': False,
+        }
+        for spec in self.specs:
+            if spec.feed == 'distance' and (self.adapter.latitude == None or self.adapter.longitude == None):
+                continue # only when the user has entered their own location
+            value = None
+            if spec.feed in initial_data:
+                value = spec.extractor(initial_data[spec.feed], self.adapter.metric)
+            weather_property = CandleWeatherProperty(
+                            self,
+                            spec.name,
+                            spec.description(self.adapter.metric),
+                            value)
+            if spec.name in self.adapter.dead_bands:
+                weather_property.dead_band, weather_property.hysteresis = self.adapter.dead_bands[spec.name]
+            self.properties[spec.name] = weather_property
+            self.handles.setdefault(spec.feed, []).append((spec.extractor, weather_property))
+        
+        self.stale_property = self.properties['stale']
+
+
+
+    # While a batch is open, changed values are collected instead of being sent to the gateway right away
+    def begin_batch(self):
+        self.batch = {}
+
+
+
+    # Applies all collected values at once, then sends a single notification per changed property. Returns the number of notifications.
+    def flush_batch(self):
+        batch = self.batch
+        self.batch = None
+        if batch == None:
+            return 0
+        for weather_property in batch:
+            weather_property.set_initial_value(batch[weather_property])
+        for weather_property in batch:
+            self.notify_property_changed(weather_property)
+        return len(batch)
+
+
+
+    # Pushes the new values from the data of one feed to the properties
+    def update_properties(self, feed, data):
+        metric = self.adapter.metric
+        for extractor, weather_property in self.handles.get(feed, ()):
+            value = extractor(data, metric)
+            if value != None:
+                weather_property.update(value)
+
+
+
+
+class CandleWeatherDevice(CandleDevice):
     """CandleWeather device type."""
 
-    def __init__(self, adapter):
+    def __init__(self, adapter, location):
         """
         Initialize the object.
         adapter -- the Adapter managing this device
+        location -- the WeatherLocation this device shows the weather for
         """
 
         
-        Device.__init__(self, adapter, 'candle-weather-today')
+        Device.__init__(self, adapter, location.today_id)
         #print("candle weather debug: Creating CandleWeather thing")
         
-        self._id = 'candle-weather-today'
-        self.id = 'candle-weather-today'
+        self._id = location.today_id
+        self.id = location.today_id
         self.adapter = adapter
         self._type.append('TemperatureSensor')
 
-        self.name = 'candle-weather-today'
-        self.title = 'Weather today'
+        self.name = location.today_id
+        self.title = 'Weather today' + location.title_suffix
         self.description = 'Candle weather data'
 
+        self.create_properties(TODAY_PROPERTIES, location)
 
         if self.adapter.DEBUG: 
-            print("candle weather debug: Empty CandleWeather today thing has been created.")
+            print("candle weather debug: CandleWeather today thing has been created.")
 
 
 
 
-class CandleTomorrowDevice(Device):
+class CandleTomorrowDevice(CandleDevice):
     """CandleWeather device type."""
 
-    def __init__(self, adapter):
+    def __init__(self, adapter, location):
         """
         Initialize the object.
         adapter -- the Adapter managing this device
+        location -- the WeatherLocation this device shows the weather for
         """
 
         
-        Device.__init__(self, adapter, 'candle-weather-tomorrow')
+        Device.__init__(self, adapter, location.tomorrow_id)
         #print("candle weather debug: Creating CandleWeather thing")
         
-        self._id = 'candle-weather-tomorrow'
-        self.id = 'candle-weather-tomorrow'
+        self._id = location.tomorrow_id
+        self.id = location.tomorrow_id
         self.adapter = adapter
         self._type.append('TemperatureSensor')
 
-        self.name = 'candle-weather-tomorrow'
-        self.title = 'Weather tomorrow'
+        self.name = location.tomorrow_id
+        self.title = 'Weather tomorrow' + location.title_suffix
         self.description = 'Candle weather prediction'
 
+        self.create_properties(TOMORROW_PROPERTIES, location)
 
         if self.adapter.DEBUG: 
-            print("candle weather debug: Empty CandleWeather tomorrow thing has been created.")
+            print("candle weather debug: CandleWeather tomorrow thing has been created.")
 
 
 
@@ -806,11 +897,49 @@ class CandleWeatherProperty(Property):
         self.name = name
         self.title = name
         self.description = description # dictionary
+        self.value = value # the value the gateway knows about
+        self.true_value = value # the latest value from the WMO, which may differ from self.value by less than the dead-band
+        self.set_cached_value(value)
+        
+        # Numeric changes smaller than the dead-band are not sent to the gateway.
+        # A change in the opposite direction of the previous one must also be larger than the hysteresis, so a value that flaps between two numbers is only sent once.
+        self.dead_band = 0
+        self.hysteresis = 0
+        self.last_direction = 0
+
+
+
+    # Sets the value before the thing has been announced to the gateway, so without a notification
+    def set_initial_value(self, value):
         self.value = value
+        self.true_value = value
         self.set_cached_value(value)
 
 
 
+    def is_significant(self, value):
+        if value == self.value:
+            return False
+        if self.dead_band == 0 and self.hysteresis == 0:
+            return True
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not isinstance(self.value, (int, float)):
+            return True
+        
+        change = value - self.value
+        direction = 1 if change > 0 else -1
+        threshold = self.dead_band
+        if self.last_direction != 0 and direction != self.last_direction:
+            threshold += self.hysteresis
+        if abs(change) + 1e-9 < threshold: # a little margin, as 13.0 - 12.9 is not exactly 0.1
+            if self.device.adapter.DEBUG:
+                print("candle weather debug: candle weather property: " + str(self.title) + ", change to " + str(value) + " is within the dead-band")
+            return False
+        
+        self.last_direction = direction
+        return True
+
+
+
     def set_value(self, value):
         #print("candle weather debug: set_value is called on a CandleWeather property by the UI. This should not be possible in this case?")
         pass
@@ -818,13 +947,20 @@ class CandleWeatherProperty(Property):
 
     def update(self, value):
         
-        if value != self.value:
+        self.device.adapter.property_touches += 1
+        self.true_value = value
+        batch = self.device.batch # only the last value of a batch is sent, and nothing if it ends up unchanged
+        if self.is_significant(value):
             if self.device.adapter.DEBUG: 
                 print("candle weather debug: candle weather property: "  + str(self.title) + ", -> update to: " + str(value))
-            self.value = value
-            self.set_cached_value(value)
-            self.device.notify_property_changed(self)
+            if batch != None:
+                batch[self] = value
+            else:
+                self.value = value
+                self.set_cached_value(value)
+                self.device.notify_property_changed(self)
         else:
-            if self.device.adapter.DEBUG: 
+            if batch != None:
+                batch.pop(self, None)
+            if self.device.adapter.DEBUG and value == self.value: 
                 print("candle weather debug: candle weather property: "  + str(self.title) + ", was already this value: " + str(value))
-
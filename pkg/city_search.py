@@ -0,0 +1,77 @@
+"""Fuzzy search through the city names, for misspelled or partly typed names."""
+
+import re
+import heapq
+import unicodedata
+from array import array
+from collections import Counter
+from itertools import chain
+
+
+_NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+
+
+
+# 'Zürich - Kloten ' -> 'zurich kloten'
+def normalize(text):
+    text = unicodedata.normalize('NFKD', str(text))
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return _NON_ALPHANUMERIC.sub(' ', text.lower()).strip()
+
+
+
+# The sets of three letters in a normalized text. Each word is padded with spaces, so the start and end of words count extra.
+def trigrams(text):
+    result = set()
+    for word in text.split():
+        word = '  ' + word + ' '
+        for i in range(len(word) - 2):
+            result.add(word[i:i + 3])
+    return result
+
+
+
+class CitySearch():
+    """A trigram index over the city names.
+    A name is scored by how many of the trigrams of the search text it contains, so typos, missing accents and partial names still find it."""
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.normalized = [normalize(name) for name in self.names]
+        self.trigram_counts = array('H')
+        self.index = {} # trigram -> array of the rows that contain it
+        for row, text in enumerate(self.normalized):
+            row_trigrams = trigrams(text)
+            self.trigram_counts.append(len(row_trigrams))
+            for trigram in row_trigrams:
+                if not trigram in self.index:
+                    self.index[trigram] = array('H')
+                self.index[trigram].append(row)
+
+
+
+    # Returns up to count (name, score) tuples, best first. The score is between 0 and 1.
+    def search(self, text, count=5):
+        query = normalize(text)
+        query_trigrams = trigrams(query)
+        if len(query_trigrams) == 0:
+            return []
+
+        # row -> number of trigrams it has in common with the query
+        shared = Counter(chain.from_iterable(self.index.get(trigram, ()) for trigram in query_trigrams))
+
+        # Rows with far fewer trigrams in common than the best ones will not end up on top, so they are not scored at all
+        candidates = shared.most_common()
+        if len(candidates) > count * 10:
+            minimum = candidates[count * 10][1]
+            candidates = [item for item in candidates if item[1] >= minimum]
+
+        scored = []
+        for row, found in candidates:
+            # mostly: how much of the query was found. A little: how much of the name was searched for, so shorter matches win ties.
+            score = 0.8 * found / len(query_trigrams) + 0.2 * found / self.trigram_counts[row]
+            if query in self.normalized[row]:
+                score = min(1.0, score + 0.1)
+            scored.append((-score, self.names[row]))
+
+        return [(name, round(-score, 3)) for score, name in heapq.nsmallest(count, scored)]
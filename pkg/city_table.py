@@ -0,0 +1,254 @@
+"""Read-only table of all the WMO cities, stored in a compact binary file that is memory mapped."""
+
+import os
+import mmap
+import math
+import struct
+
+
+CITY_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cities.bin')
+
+_MAGIC = b'CWCT'
+_VERSION = 2
+
+# magic, version, reserved, number of cities
+_HEADER = struct.Struct('<4sHHI')
+
+# After the header come these sections, in this order. All numbers are little-endian.
+#   name offsets        (count + 1) x uint32, into the text bytes. The names are sorted by their UTF-8 bytes.
+#   city IDs            count x int32
+#   latitudes           count x float32, NaN if unknown
+#   longitudes          count x float32, NaN if unknown
+#   time zones          count x int16, minutes ahead of UTC, _UNKNOWN_TIME_ZONE if unknown
+#   daylight saving     count x uint8, 0 or 1, _UNKNOWN if unknown
+#   stations            count x uint16, number of a text, _NO_TEXT if unknown
+#   organisations       count x uint16, number of a text, _NO_TEXT if unknown
+#   ID order            count x uint16, the row numbers sorted by city ID
+#   number of texts     uint32, the station and organisation names, each stored once
+#   text offsets        (texts + 1) x uint32, into the text bytes
+#   text bytes          all city names, followed by the texts, UTF-8 encoded, one after the other
+_OFFSET = struct.Struct('<I')
+_CITY_ID = struct.Struct('<i')
+_COORDINATE = struct.Struct('<f')
+_TIME_ZONE = struct.Struct('<h')
+_FLAG = struct.Struct('<B')
+_ROW = struct.Struct('<H')
+
+_UNKNOWN_TIME_ZONE = -0x8000
+_UNKNOWN = 0xFF
+_NO_TEXT = 0xFFFF
+
+
+
+# Turns a list of cities into the bytes of a city table file.
+# Each city is a dictionary with a 'name' and 'city_id', and optionally 'latitude', 'longitude', 'time_zone' (minutes ahead of UTC),
+# 'dst' (True or False), 'station' and 'organisation'.
+def pack_city_table(cities):
+    cities = sorted(cities, key=lambda city: city['name'].encode('utf-8'))
+    count = len(cities)
+    if count >= 0xFFFF:
+        raise ValueError("too many cities for the ID order section")
+
+    # station and organisation names are stored once, after the city names
+    texts = [city['name'] for city in cities]
+    text_index = {}
+    def add_text(text):
+        if text == None or text == '':
+            return _NO_TEXT
+        if not text in text_index:
+            text_index[text] = len(texts) - count
+            texts.append(text)
+        return text_index[text]
+    stations = [add_text(city.get('station')) for city in cities]
+    organisations = [add_text(city.get('organisation')) for city in cities]
+    if len(texts) - count >= _NO_TEXT:
+        raise ValueError("too many station and organisation names")
+
+    text_bytes = b''
+    offsets = [0]
+    for text in texts:
+        text_bytes += text.encode('utf-8')
+        offsets.append(len(text_bytes))
+
+    time_zones = []
+    dst = []
+    for city in cities:
+        time_zones.append(_UNKNOWN_TIME_ZONE if city.get('time_zone') == None else int(city['time_zone']))
+        dst.append(_UNKNOWN if city.get('dst') == None else int(bool(city['dst'])))
+
+    id_order = sorted(range(count), key=lambda row: cities[row]['city_id'])
+
+    data = _HEADER.pack(_MAGIC, _VERSION, 0, count)
+    data += struct.pack('<' + str(count + 1) + 'I', *offsets[:count + 1])
+    data += struct.pack('<' + str(count) + 'i', *[city['city_id'] for city in cities])
+    data += struct.pack('<' + str(count) + 'f', *[city.get('latitude', math.nan) for city in cities])
+    data += struct.pack('<' + str(count) + 'f', *[city.get('longitude', math.nan) for city in cities])
+    data += struct.pack('<' + str(count) + 'h', *time_zones)
+    data += struct.pack('<' + str(count) + 'B', *dst)
+    data += struct.pack('<' + str(count) + 'H', *stations)
+    data += struct.pack('<' + str(count) + 'H', *organisations)
+    data += struct.pack('<' + str(count) + 'H', *id_order)
+    extra_offsets = offsets[count:]
+    data += _OFFSET.pack(len(extra_offsets) - 1)
+    data += struct.pack('<' + str(len(extra_offsets)) + 'I', *extra_offsets)
+    data += text_bytes
+    return data
+
+
+
+class CityTable():
+    """Looks up cities by binary search in the memory mapped table file.
+    Only the cities that are actually looked up are turned into Python objects."""
+
+    def __init__(self, path=CITY_TABLE_PATH):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, reserved, self.count = _HEADER.unpack_from(self.map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("not a city table, or an unsupported version: " + str(path))
+
+        self.offsets_start = _HEADER.size
+        self.city_ids_start = self.offsets_start + (self.count + 1) * _OFFSET.size
+        self.latitudes_start = self.city_ids_start + self.count * _CITY_ID.size
+        self.longitudes_start = self.latitudes_start + self.count * _COORDINATE.size
+        self.time_zones_start = self.longitudes_start + self.count * _COORDINATE.size
+        self.dst_start = self.time_zones_start + self.count * _TIME_ZONE.size
+        self.stations_start = self.dst_start + self.count * _FLAG.size
+        self.organisations_start = self.stations_start + self.count * _ROW.size
+        self.id_order_start = self.organisations_start + self.count * _ROW.size
+        self.text_count = _OFFSET.unpack_from(self.map, self.id_order_start + self.count * _ROW.size)[0]
+        self.text_offsets_start = self.id_order_start + self.count * _ROW.size + _OFFSET.size
+        self.names_start = self.text_offsets_start + (self.text_count + 1) * _OFFSET.size
+
+
+
+    def __len__(self):
+        return self.count
+
+
+
+    def name_bytes(self, row):
+        start = _OFFSET.unpack_from(self.map, self.offsets_start + row * _OFFSET.size)[0]
+        end = _OFFSET.unpack_from(self.map, self.offsets_start + (row + 1) * _OFFSET.size)[0]
+        return self.map[self.names_start + start:self.names_start + end]
+
+
+
+    def name(self, row):
+        return self.name_bytes(row).decode('utf-8')
+
+
+
+    # A station or organisation name
+    def text(self, index):
+        if index == _NO_TEXT:
+            return None
+        start = _OFFSET.unpack_from(self.map, self.text_offsets_start + index * _OFFSET.size)[0]
+        end = _OFFSET.unpack_from(self.map, self.text_offsets_start + (index + 1) * _OFFSET.size)[0]
+        return self.map[self.names_start + start:self.names_start + end].decode('utf-8')
+
+
+
+    def city_id(self, row):
+        return _CITY_ID.unpack_from(self.map, self.city_ids_start + row * _CITY_ID.size)[0]
+
+
+
+    # Returns (latitude, longitude), or None if the location of the city is not known
+    def location(self, row):
+        latitude = _COORDINATE.unpack_from(self.map, self.latitudes_start + row * _COORDINATE.size)[0]
+        longitude = _COORDINATE.unpack_from(self.map, self.longitudes_start + row * _COORDINATE.size)[0]
+        if math.isnan(latitude) or math.isnan(longitude):
+            return None
+        return latitude, longitude
+
+
+
+    # What is known about the station of a city. Values that are not known are None.
+    def details(self, row):
+        time_zone = _TIME_ZONE.unpack_from(self.map, self.time_zones_start + row * _TIME_ZONE.size)[0]
+        dst = _FLAG.unpack_from(self.map, self.dst_start + row * _FLAG.size)[0]
+        return {
+            'location': self.location(row),
+            'time_zone': None if time_zone == _UNKNOWN_TIME_ZONE else time_zone, # minutes ahead of UTC
+            'dst': None if dst == _UNKNOWN else bool(dst),
+            'station': self.text(_ROW.unpack_from(self.map, self.stations_start + row * _ROW.size)[0]),
+            'organisation': self.text(_ROW.unpack_from(self.map, self.organisations_start + row * _ROW.size)[0]),
+        }
+
+
+
+    # The first row whose name is not smaller than key (bytes)
+    def lower_bound(self, key):
+        low = 0
+        high = self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.name_bytes(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+
+    # The row of a 'Country - City' name, or None
+    def find(self, name):
+        key = name.encode('utf-8')
+        row = self.lower_bound(key)
+        if row < self.count and self.name_bytes(row) == key:
+            return row
+        return None
+
+
+
+    # The row of a city ID, or None
+    def find_city_id(self, city_code):
+        city_code = int(city_code)
+        low = 0
+        high = self.count
+        while low < high:
+            middle = (low + high) // 2
+            row = _ROW.unpack_from(self.map, self.id_order_start + middle * _ROW.size)[0]
+            found = self.city_id(row)
+            if found == city_code:
+                return row
+            if found < city_code:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+
+
+    # The rows of all names that start with the prefix. The names are sorted, so these rows are next to each other.
+    def prefix_rows(self, prefix):
+        key = prefix.encode('utf-8')
+        first = self.lower_bound(key)
+        last = first
+        while last < self.count and self.name_bytes(last).startswith(key):
+            last += 1
+        return range(first, last)
+
+
+
+    # All the names of the cities in a country
+    def country_cities(self, country):
+        return [self.name(row) for row in self.prefix_rows(country + ' - ')]
+
+
+
+    def countries(self):
+        countries = []
+        for row in range(self.count):
+            country = self.name(row).split(' - ', 1)[0]
+            if len(countries) == 0 or countries[-1] != country:
+                countries.append(country)
+        return countries
+
+
+
+    def names(self):
+        for row in range(self.count):
+            yield self.name(row)
@@ -0,0 +1,312 @@
+"""Helpers for downloading data from the WMO server."""
+
+import time
+import socket
+import threading
+import zlib
+import http.client
+from urllib.parse import urlsplit, urljoin
+
+
+# Sent with every request, so the server may compress the response
+ACCEPT_ENCODING = 'gzip, deflate'
+
+_CHUNK_SIZE = 16384
+_TIMEOUT = 20
+_MAX_IDLE_TIME = 30 # seconds after which an unused connection is closed
+_MAX_REDIRECTS = 3
+_MAX_CONNECTIONS_PER_HOST = 4 # to be polite to the WMO server, never more requests than this at the same time
+_MAX_DRAIN = 262144 # unread bytes that are still worth downloading just to keep the connection open
+
+# Errors that mean a kept-alive connection was closed by the server while it sat idle
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+
+
+class ConnectionPool():
+    """Keeps HTTP connections open between requests, so that several downloads from the same server only need one (TLS) handshake."""
+
+    def __init__(self, timeout=_TIMEOUT, max_idle_time=_MAX_IDLE_TIME, max_per_host=_MAX_CONNECTIONS_PER_HOST, debug=False):
+        self.timeout = timeout
+        self.max_idle_time = max_idle_time
+        self.max_per_host = max_per_host
+        self.debug = debug
+        self.host_slots = {} # (scheme, host, port) -> semaphore that limits the number of requests to that host
+        self.idle = {} # (scheme, host, port) -> list of [connection, time it was returned to the pool]
+        self.active = set() # connections that are being used for a request right now
+        self.lock = threading.Lock()
+
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.handshake_time = 0.0
+        self.transfer_time = 0.0
+
+
+
+    def request(self, url, headers=None):
+        if headers == None:
+            headers = {}
+
+        for redirect in range(_MAX_REDIRECTS + 1):
+            response = self._request_once(url, headers)
+            if response.status in (301, 302, 303, 307, 308) and response.headers.get('Location'):
+                response.read()
+                response.close()
+                url = urljoin(url, response.headers.get('Location'))
+                continue
+            return response
+
+        return response
+
+
+
+    def _request_once(self, url, headers):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        with self.lock:
+            if not key in self.host_slots:
+                self.host_slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            slot = self.host_slots[key]
+        
+        # waits while the maximum number of requests to this host are already in progress. The response gives the slot back when it is closed.
+        slot.acquire()
+        try:
+            connection = self._checkout(key)
+            if connection != None:
+                try:
+                    return self._send(key, connection, path, headers, slot)
+                except _STALE_CONNECTION_ERRORS:
+                    if self.debug:
+                        print("candle weather debug: kept-alive connection was closed by the server, reconnecting")
+                    connection.close()
+
+            connection = self._connect(key)
+            return self._send(key, connection, path, headers, slot)
+        except Exception:
+            slot.release()
+            raise
+
+
+
+    def _checkout(self, key):
+        now = time.monotonic()
+        with self.lock:
+            connections = self.idle.get(key, [])
+            while len(connections) > 0:
+                connection, returned = connections.pop()
+                if now - returned < self.max_idle_time:
+                    self.connections_reused += 1
+                    self.active.add(connection)
+                    return connection
+                connection.close()
+        return None
+
+
+
+    def _connect(self, key):
+        scheme, host, port = key
+        if scheme == 'https':
+            connection = http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        else:
+            connection = http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+        with self.lock:
+            self.active.add(connection)
+        start = time.monotonic()
+        try:
+            connection.connect()
+        except Exception:
+            self.release(None, connection, False, 0)
+            raise
+        handshake_time = time.monotonic() - start
+
+        with self.lock:
+            self.connections_opened += 1
+            self.handshake_time += handshake_time
+        if self.debug:
+            print("candle weather debug: connected to " + str(host) + ", handshake took " + str(round(handshake_time, 3)) + " seconds")
+        return connection
+
+
+
+    def _send(self, key, connection, path, headers, slot):
+        start = time.monotonic()
+        try:
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+        except Exception:
+            with self.lock:
+                self.active.discard(connection)
+            connection.close()
+            raise
+        return PooledResponse(self, key, connection, response, time.monotonic() - start, slot)
+
+
+
+    # Called by a response once it is done with its connection
+    def release(self, key, connection, reusable, transfer_time):
+        with self.lock:
+            self.active.discard(connection)
+            self.transfer_time += transfer_time
+            if reusable:
+                self.idle.setdefault(key, []).append([connection, time.monotonic()])
+                return
+        connection.close()
+
+
+
+    # Closes connections that have been unused for too long, or all of them
+    def close_idle(self, everything=False):
+        now = time.monotonic()
+        with self.lock:
+            for key in list(self.idle.keys()):
+                keep = []
+                for connection, returned in self.idle[key]:
+                    if everything or now - returned >= self.max_idle_time:
+                        connection.close()
+                    else:
+                        keep.append([connection, returned])
+                self.idle[key] = keep
+
+
+
+    # Closes every connection, including those of downloads that are still in progress. Used when the addon shuts down.
+    def close_all(self):
+        self.close_idle(everything=True)
+        with self.lock:
+            active = list(self.active)
+        for connection in active:
+            try:
+                if connection.sock != None:
+                    connection.sock.shutdown(socket.SHUT_RDWR) # wakes up a thread that is waiting for data
+            except Exception:
+                pass
+
+
+
+    def stats(self):
+        with self.lock:
+            return {
+                'connections_opened': self.connections_opened,
+                'connections_reused': self.connections_reused,
+                'handshake_time': round(self.handshake_time, 3),
+                'transfer_time': round(self.transfer_time, 3),
+            }
+
+
+
+class PooledResponse():
+    """A response that gives its connection back to the pool once the body has been fully read."""
+
+    def __init__(self, pool, key, connection, response, transfer_time, slot):
+        self.pool = pool
+        self.slot = slot
+        self.key = key
+        self.connection = connection
+        self.response = response
+        self.status = response.status
+        self.headers = response.headers
+        self.transfer_time = transfer_time
+        self.released = False
+
+
+
+    def read(self, size=-1):
+        start = time.monotonic()
+        if size == None or size < 0:
+            data = self.response.read()
+        else:
+            data = self.response.read(size)
+        self.transfer_time += time.monotonic() - start
+        return data
+
+
+
+    def close(self):
+        if self.released:
+            return
+        self.released = True
+        # A partly read response (e.g. when the present.xml scan stopped early) can only be reused once the rest of it has been read.
+        # If only a little is left (which is the case with compressed responses) that is cheaper than a new handshake.
+        try:
+            drained = 0
+            while not self.response.isclosed() and drained <= _MAX_DRAIN:
+                data = self.read(_CHUNK_SIZE)
+                if not data:
+                    break
+                drained += len(data)
+        except Exception:
+            pass
+        reusable = self.response.isclosed() and not self.response.will_close
+        if not reusable:
+            self.response.close()
+        self.pool.release(self.key, self.connection, reusable, self.transfer_time)
+        self.slot.release()
+
+
+
+class DecompressingReader():
+    """Wraps a gzip or deflate encoded HTTP response, and decompresses it bit by bit while it is being read."""
+
+    def __init__(self, response, encoding, chunk_size=_CHUNK_SIZE):
+        self.response = response
+        self.headers = response.headers
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self.decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS) # accepts both gzip and zlib headers
+        self.first_chunk = True
+        self.finished = False
+
+
+
+    def read(self, size=-1):
+        if size == None or size < 0:
+            parts = []
+            while True:
+                part = self.read(self.chunk_size)
+                if not part:
+                    return b''.join(parts)
+                parts.append(part)
+
+        while not self.finished:
+            data = self.decompressor.unconsumed_tail
+            if not data:
+                data = self.response.read(self.chunk_size)
+                if not data:
+                    self.finished = True
+                    return self.decompressor.flush()
+
+            try:
+                output = self.decompressor.decompress(data, size)
+            except zlib.error:
+                if self.first_chunk == False or self.encoding != 'deflate':
+                    raise
+                # Some servers send 'deflate' without the zlib header
+                self.decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                output = self.decompressor.decompress(data, size)
+            self.first_chunk = False
+
+            if self.decompressor.eof:
+                self.finished = True
+            if output:
+                return output
+
+        return b''
+
+
+
+    def close(self):
+        self.response.close()
+
+
+
+# Returns something that can be read like the response, but always gives the plain, uncompressed bytes
+def decoded_stream(response):
+    encoding = str(response.headers.get('Content-Encoding', 'identity')).strip().lower()
+    if encoding in ('gzip', 'x-gzip', 'deflate'):
+        return DecompressingReader(response, encoding)
+    return response
@@ -0,0 +1,90 @@
+"""Incremental reader for the WMO present.xml feed."""
+
+import codecs
+import json
+import re
+
+
+_CHUNK_SIZE = 16384
+
+# Every station record starts with its cityId, e.g. "cityId": 143
+_CITY_ID_PATTERN = re.compile(r'"cityId"\s*:\s*"?(\d+)')
+
+
+
+# Yields the station records from a present.xml stream whose cityId is in city_codes,
+# or all station records if city_codes is None.
+# The stream only needs a read(size) method. Reading stops as soon as every wanted
+# city has been found, and only about one chunk of text is ever kept in memory.
+def scan_present(stream, city_codes, chunk_size=_CHUNK_SIZE):
+    wanted = None
+    if city_codes != None:
+        wanted = set()
+        for city_code in city_codes:
+            if city_code != None:
+                wanted.add(int(city_code))
+
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    json_decoder = json.JSONDecoder()
+
+    buffer = ''
+    position = 0
+    in_present = False
+    end_of_stream = False
+
+    while wanted == None or len(wanted) > 0:
+
+        if in_present == False:
+            start = buffer.find('"present"', position)
+            if start != -1:
+                brace = buffer.find('{', start)
+                if brace != -1:
+                    in_present = True
+                    position = brace + 1
+                    continue
+                position = start
+            else:
+                # keep a little tail in case the key is split over two chunks
+                position = max(position, len(buffer) - 16)
+
+        else:
+            record_start = buffer.find('{', position)
+            if record_start != -1:
+                record_end = buffer.find('}', record_start)
+                if record_end != -1:
+                    match = _CITY_ID_PATTERN.search(buffer, record_start, record_end)
+                    if match == None or (wanted != None and int(match.group(1)) not in wanted):
+                        position = record_end + 1
+                        continue
+
+                    try:
+                        record, record_end = json_decoder.raw_decode(buffer, record_start)
+                    except ValueError:
+                        # a closing brace inside a string value, the record continues in the next chunk
+                        record = None
+
+                    if record != None:
+                        position = record_end
+                        if wanted != None:
+                            wanted.discard(int(match.group(1)))
+                        yield record
+                        continue
+
+                    position = record_start
+                else:
+                    position = record_start
+            else:
+                position = len(buffer)
+
+        if end_of_stream:
+            break
+
+        chunk = stream.read(chunk_size)
+        buffer = buffer[position:]
+        position = 0
+        if chunk:
+            buffer += text_decoder.decode(chunk)
+        else:
+            buffer += text_decoder.decode(b'', final=True)
+            end_of_stream = True
+
@@ -0,0 +1,172 @@
+"""Remembers downloaded responses, so that unchanged data does not have to be downloaded again."""
+
+import os
+import time
+import json
+import hashlib
+import threading
+
+from .util import write_atomic
+
+
+_MAX_SIZE = 2 * 1024 * 1024 # bytes of response bodies to keep on disk
+_DEFAULT_TTL = 600
+
+
+
+class ResponseCache():
+    """Stores the validators (ETag, Last-Modified) and the last body per URL on disk.
+    Each entry is considered fresh for its own time-to-live. When the total size grows too large, the least recently used entries are removed."""
+
+    def __init__(self, cache_dir, max_size=_MAX_SIZE, debug=False):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.debug = debug
+        self.index_path = os.path.join(self.cache_dir, 'index.json')
+        self.index = {}
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            if os.path.isfile(self.index_path):
+                with open(self.index_path) as f:
+                    self.index = json.load(f)
+        except Exception as ex:
+            print("candle weather debug: Error loading response cache index: " + str(ex))
+            self.index = {}
+
+
+
+    # The key is usually the URL. A different key can be used when the stored body is only a part of the full response.
+    def body_path(self, key):
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.body')
+
+
+
+    # Headers that turn a request into a conditional one. Only sent when there is a stored body to fall back on.
+    def conditional_headers(self, key):
+        headers = {}
+        with self.lock:
+            entry = self.index.get(key)
+        if entry != None and os.path.isfile(self.body_path(key)):
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+
+
+    # Returns the stored body if it is younger than its time-to-live, so no request is needed at all
+    def get_fresh(self, key):
+        with self.lock:
+            entry = self.index.get(key)
+            fresh = entry != None and time.time() - entry.get('stored', 0) < entry.get('ttl', _DEFAULT_TTL)
+        body = None
+        if fresh:
+            body = self.load(key)
+        with self.lock:
+            if body != None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return body
+
+
+
+    # Returns the stored body, however old it is
+    def load(self, key):
+        with self.lock:
+            if not key in self.index:
+                return None
+            self.index[key]['last_access'] = time.time()
+        try:
+            with open(self.body_path(key), 'rb') as f:
+                return f.read()
+        except Exception as ex:
+            if self.debug:
+                print("candle weather debug: Error loading cached body for " + str(key) + ": " + str(ex))
+            return None
+
+
+
+    # response_headers is the header object of the HTTP response the body came from
+    def store(self, key, body, response_headers, ttl=_DEFAULT_TTL):
+        try:
+            write_atomic(self.body_path(key), body)
+            now = time.time()
+            with self.lock:
+                self.index[key] = {
+                    'etag': response_headers.get('ETag'),
+                    'last_modified': response_headers.get('Last-Modified'),
+                    'stored': now,
+                    'last_access': now,
+                    'ttl': ttl,
+                    'size': len(body),
+                }
+                self._evict()
+            self.save_index()
+        except Exception as ex:
+            print("candle weather debug: Error storing response in cache: " + str(ex))
+
+
+
+    # The server confirmed (304) that the stored body is still up to date, so it is fresh again
+    def touch(self, key, ttl=_DEFAULT_TTL):
+        with self.lock:
+            if not key in self.index:
+                return
+            self.index[key]['stored'] = time.time()
+            self.index[key]['ttl'] = ttl
+        self.save_index()
+
+
+
+    # Removes the least recently used entries until the total size fits. Call with the lock held.
+    def _evict(self):
+        total_size = 0
+        for key in self.index:
+            total_size += self.index[key].get('size', 0)
+
+        for key in sorted(self.index.keys(), key=lambda k: self.index[k].get('last_access', 0)):
+            if total_size <= self.max_size:
+                break
+            total_size -= self.index[key].get('size', 0)
+            del self.index[key]
+            self.evictions += 1
+            try:
+                os.remove(self.body_path(key))
+            except Exception:
+                pass
+            if self.debug:
+                print("candle weather debug: evicted from response cache: " + str(key))
+
+
+
+    def save_index(self):
+        try:
+            with self.lock:
+                data = json.dumps(self.index).encode('utf-8')
+            write_atomic(self.index_path, data)
+        except Exception as ex:
+            print("candle weather debug: Error saving response cache index: " + str(ex))
+
+
+
+    def stats(self):
+        with self.lock:
+            size = 0
+            for key in self.index:
+                size += self.index[key].get('size', 0)
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.index),
+                'size': size,
+            }
@@ -0,0 +1,177 @@
+"""Runs the periodic jobs of the addon."""
+
+import math
+import time
+import calendar
+
+
+_ADAPTIVE_MARGIN = 300 # check this many seconds after new data is expected
+_ADAPTIVE_MIN_DELAY = 600
+_ISSUE_HISTORY = 8
+_CHECK_HISTORY = 16
+
+
+
+class Scheduler():
+    """Keeps a deadline for each job, and sleeps until the first one is due.
+    Deadlines are based on time.monotonic(), so the time a job takes, or a change of the system clock, does not make the schedule drift."""
+
+    def __init__(self, stop_event, debug=False):
+        self.stop_event = stop_event
+        self.debug = debug
+        self.jobs = {}
+
+
+
+    # Jobs that share a function and are due at the same moment are combined into a single call.
+    # The function is called with the list of names of the jobs that are due.
+    # It may return a dictionary with a delay in seconds per job name, to plan the next run of that job differently from its period.
+    def add_job(self, name, period, function, delay=0):
+        self.jobs[name] = {
+            'period': period,
+            'function': function,
+            'due': time.monotonic() + delay,
+        }
+
+
+
+    # Runs until the stop event is set
+    def run(self):
+        while not self.stop_event.is_set():
+            now = time.monotonic()
+
+            if len(self.jobs) == 0:
+                self.stop_event.wait()
+                break
+
+            next_due = min(job['due'] for job in self.jobs.values())
+            if next_due > now:
+                self.stop_event.wait(next_due - now)
+                continue
+
+            due_jobs = {} # function -> names of the jobs that are due
+            for name in self.jobs:
+                job = self.jobs[name]
+                if job['due'] <= now:
+                    # the next deadline is counted from when this run was due, not from when it finishes
+                    job['due'] += job['period']
+                    if job['due'] <= now:
+                        job['due'] = now + job['period'] # we fell behind by more than a whole period
+                    due_jobs.setdefault(job['function'], []).append(name)
+
+            for function in due_jobs:
+                if self.stop_event.is_set():
+                    break
+                if self.debug:
+                    print("candle weather debug: running scheduled job(s): " + str(due_jobs[function]))
+                try:
+                    delays = function(due_jobs[function])
+                    if isinstance(delays, dict):
+                        for name in delays:
+                            if name in self.jobs and delays[name] != None:
+                                self.jobs[name]['due'] = time.monotonic() + delays[name]
+                except Exception as ex:
+                    if not self.stop_event.is_set():
+                        print("candle weather debug: Error in scheduled job " + str(due_jobs[function]) + ": " + str(ex))
+
+
+
+
+# Turns an issue stamp from the WMO feeds into seconds. Present data uses '202210210900', predictions use '2022-10-20 09:30:00'.
+# Only the differences between stamps of the same feed are used, so the time zone does not matter.
+def parse_issue_stamp(stamp):
+    digits = ''.join(c for c in str(stamp) if c.isdigit())
+    if len(digits) < 12:
+        return None
+    try:
+        return calendar.timegm(time.strptime(digits[:12], '%Y%m%d%H%M'))
+    except ValueError:
+        return None
+
+
+
+class AdaptivePoller():
+    """Learns from the issue stamps how often a feed publishes new data, and how long after its issue time new data becomes available.
+    The next check is planned shortly after the next issue is expected, which may be sooner than the default period."""
+
+    def __init__(self, default_period, margin=_ADAPTIVE_MARGIN, min_delay=_ADAPTIVE_MIN_DELAY, clock=time.time):
+        self.default_period = default_period
+        self.margin = margin
+        self.min_delay = min_delay
+        self.clock = clock # wall clock time, as it is compared with the issue stamps
+        self.issue_times = [] # the most recent distinct issue stamps, in seconds
+        self.ages = [] # the age of the newest issue at each recent check, in seconds
+        self.unchanged_ages = [] # the same, at recent checks that found no new issue
+        self.unchanged_count = 0
+
+
+
+    # The time between two issues, or None if that is not known yet
+    def cadence(self):
+        deltas = []
+        for i in range(1, len(self.issue_times)):
+            delta = self.issue_times[i] - self.issue_times[i - 1]
+            if delta > 0:
+                deltas.append(delta)
+        if len(deltas) == 0:
+            return None
+
+        # When the checks are further apart than the issues, some issues are never seen and the deltas are multiples of the cadence
+        divisor = 0
+        for delta in deltas:
+            divisor = math.gcd(divisor, int(round(delta / 60)))
+        if divisor * 60 >= self.min_delay:
+            return divisor * 60
+
+        # the stamps are irregular
+        deltas.sort()
+        return deltas[len(deltas) // 2]
+
+
+
+    # How long after its issue time an issue becomes available, as (lower bound, upper bound) in seconds.
+    # At every check the newest issue was available, so the lag is at most its age. The issue after it was not, so the lag is more than the age minus the cadence.
+    # The checks that found nothing new are remembered longer, as they are the ones that tell how early is too early.
+    # The stamps may be in another time zone. That offset is the same at every check, so it simply becomes part of the lag.
+    def lag_bounds(self, cadence):
+        return max(self.ages + self.unchanged_ages) - cadence, min(self.ages)
+
+
+
+    # Called after every check with the latest issue stamp. Returns the number of seconds until the next check.
+    def observe(self, stamp):
+        now = self.clock()
+
+        issue_time = parse_issue_stamp(stamp)
+        if issue_time != None and (len(self.issue_times) == 0 or issue_time > self.issue_times[-1]):
+            self.issue_times.append(issue_time)
+            self.issue_times = self.issue_times[-_ISSUE_HISTORY:]
+            self.unchanged_count = 0
+        else:
+            self.unchanged_count += 1
+
+        if len(self.issue_times) == 0:
+            return self.default_period
+        age = now - self.issue_times[-1]
+        self.ages.append(age)
+        self.ages = self.ages[-_CHECK_HISTORY:]
+        if self.unchanged_count > 0:
+            self.unchanged_ages.append(age)
+            self.unchanged_ages = self.unchanged_ages[-_ISSUE_HISTORY:]
+
+        cadence = self.cadence()
+        if cadence == None:
+            return self.default_period
+
+        lowest_lag, highest_lag = self.lag_bounds(cadence)
+        if lowest_lag < highest_lag:
+            lag = (lowest_lag + highest_lag) / 2 # each check narrows the range down further
+        else:
+            lag = highest_lag # an issue was skipped or late, so the lower bound is not reliable
+
+        # the next issue is one cadence after the newest one
+        delay = cadence + lag + self.margin - age
+        if age >= cadence + highest_lag:
+            # the next issue is later than it has ever been, so wait longer and longer before checking again
+            delay = self.margin * (2 ** self.unchanged_count)
+        return min(max(delay, self.min_delay), max(cadence, self.default_period) + self.margin)
@@ -0,0 +1,94 @@
+"""Finds the cities closest to a location."""
+
+import math
+import heapq
+from array import array
+
+
+EARTH_RADIUS = 6371.0 # kilometers
+
+
+
+# Great circle distance in kilometers
+def distance_km(latitude1, longitude1, latitude2, longitude2):
+    latitude1, longitude1, latitude2, longitude2 = map(math.radians, (latitude1, longitude1, latitude2, longitude2))
+    a = math.sin((latitude2 - latitude1) / 2) ** 2 + math.cos(latitude1) * math.cos(latitude2) * math.sin((longitude2 - longitude1) / 2) ** 2
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+
+# A point on a sphere with radius 1. The straight line distance between two of these grows with the distance over the earth,
+# so the tree can use simple coordinates without any trouble around the poles or the date line.
+def _to_vector(latitude, longitude):
+    latitude = math.radians(latitude)
+    longitude = math.radians(longitude)
+    return (math.cos(latitude) * math.cos(longitude), math.cos(latitude) * math.sin(longitude), math.sin(latitude))
+
+
+
+class SpatialIndex():
+    """A k-d tree over the locations of the cities.
+    The tree is stored in flat arrays: the middle item of every range is the node, the items before and after it are its two subtrees."""
+
+    def __init__(self, points):
+        """points -- list of (latitude, longitude, row), where row is the row of the city in the city table"""
+        nodes = [_to_vector(latitude, longitude) + (row,) for latitude, longitude, row in points]
+        self._build(nodes, 0, len(nodes), 0)
+        self.axes = (array('d', [node[0] for node in nodes]), array('d', [node[1] for node in nodes]), array('d', [node[2] for node in nodes]))
+        self.rows = array('l', [node[3] for node in nodes])
+
+
+
+    def __len__(self):
+        return len(self.rows)
+
+
+
+    def _build(self, nodes, low, high, depth):
+        if high - low <= 1:
+            return
+        axis = depth % 3
+        nodes[low:high] = sorted(nodes[low:high], key=lambda node: node[axis])
+        middle = (low + high) // 2
+        self._build(nodes, low, middle, depth + 1)
+        self._build(nodes, middle + 1, high, depth + 1)
+
+
+
+    # Returns up to count (distance in kilometers, row) tuples, closest first
+    def nearest(self, latitude, longitude, count=1):
+        target = _to_vector(latitude, longitude)
+        heap = [] # (-squared straight line distance, row), the furthest of the best ones so far on top
+        self._search(0, len(self.rows), 0, target, count, heap)
+
+        results = []
+        for negative_distance, row in sorted(heap, reverse=True):
+            chord = math.sqrt(-negative_distance)
+            results.append((2 * EARTH_RADIUS * math.asin(min(1.0, chord / 2)), row))
+        return results
+
+
+
+    def _search(self, low, high, depth, target, count, heap):
+        if low >= high:
+            return
+        middle = (low + high) // 2
+        xs, ys, zs = self.axes
+        dx = target[0] - xs[middle]
+        dy = target[1] - ys[middle]
+        dz = target[2] - zs[middle]
+        squared_distance = dx * dx + dy * dy + dz * dz
+        if len(heap) < count:
+            heapq.heappush(heap, (-squared_distance, self.rows[middle]))
+        elif squared_distance < -heap[0][0]:
+            heapq.heapreplace(heap, (-squared_distance, self.rows[middle]))
+
+        difference = (dx, dy, dz)[depth % 3]
+        if difference < 0:
+            self._search(low, middle, depth + 1, target, count, heap)
+            if len(heap) < count or difference * difference < -heap[0][0]:
+                self._search(middle + 1, high, depth + 1, target, count, heap)
+        else:
+            self._search(middle + 1, high, depth + 1, target, count, heap)
+            if len(heap) < count or difference * difference < -heap[0][0]:
+                self._search(low, middle, depth + 1, target, count, heap)
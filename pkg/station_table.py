@@ -0,0 +1,163 @@
+"""Compact table with the current weather of WMO stations, as it is kept in the response cache."""
+
+import json
+import math
+from array import array
+
+
+_NUMBER_COLUMNS = ('temp', 'rh', 'ws')
+_STRING_COLUMNS = ('wd', 'wxdesc')
+_TIME_COLUMNS = ('sunrise', 'sunset')
+
+
+
+# Numbers in present.xml are sometimes numbers, sometimes strings, and empty when a station has no data
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+
+# '06:05' -> 365 minutes after midnight, or -1 if unknown
+def _to_minutes(value):
+    try:
+        hours, minutes = str(value).split(':')
+        return int(hours) * 60 + int(minutes)
+    except ValueError:
+        return -1
+
+
+
+class StationTable():
+    """Stores the present.xml records column by column, in typed arrays.
+    Strings that repeat a lot (wind direction and weather description) are stored once, and referred to by number.
+    Instead of a dictionary per station this takes a few dozen bytes per station."""
+
+    def __init__(self):
+        self.city_ids = array('l')
+        self.issues = array('q') # e.g. 202210210900
+        self.numbers = {}
+        for name in _NUMBER_COLUMNS:
+            self.numbers[name] = array('f') # NaN when the station did not report it
+        self.string_codes = {}
+        for name in _STRING_COLUMNS:
+            self.string_codes[name] = array('H') # index in self.strings
+        self.times = {}
+        for name in _TIME_COLUMNS:
+            self.times[name] = array('h') # minutes after midnight, -1 when unknown
+
+        self.strings = []
+        self.string_index = {}
+        self.rows = {} # cityId -> row number
+
+
+
+    def __len__(self):
+        return len(self.city_ids)
+
+
+
+    def intern(self, value):
+        value = str(value)
+        code = self.string_index.get(value)
+        if code == None:
+            code = len(self.strings)
+            self.strings.append(value)
+            self.string_index[value] = code
+        return code
+
+
+
+    # Adds a station record as found in present.xml
+    def add(self, record):
+        try:
+            city_id = int(record['cityId'])
+        except (KeyError, TypeError, ValueError):
+            return
+        if city_id in self.rows:
+            return
+
+        self.rows[city_id] = len(self.city_ids)
+        self.city_ids.append(city_id)
+        try:
+            self.issues.append(int(record.get('issue')))
+        except (TypeError, ValueError):
+            self.issues.append(0)
+        for name in _NUMBER_COLUMNS:
+            self.numbers[name].append(_to_float(record.get(name)))
+        for name in _STRING_COLUMNS:
+            self.string_codes[name].append(self.intern(record.get(name, '')))
+        for name in _TIME_COLUMNS:
+            self.times[name].append(_to_minutes(record.get(name)))
+
+
+
+    # Rebuilds a record in the same shape as in present.xml, with '' for missing values
+    def get(self, city_id):
+        row = self.rows.get(int(city_id))
+        if row == None:
+            return None
+        record = {
+            'cityId': self.city_ids[row],
+            'issue': str(self.issues[row]) if self.issues[row] else '',
+        }
+        for name in _NUMBER_COLUMNS:
+            number = self.numbers[name][row]
+            record[name] = '' if math.isnan(number) else round(number, 1)
+        for name in _STRING_COLUMNS:
+            record[name] = self.strings[self.string_codes[name][row]]
+        for name in _TIME_COLUMNS:
+            minutes = self.times[name][row]
+            record[name] = '' if minutes < 0 else '{:02d}:{:02d}'.format(minutes // 60, minutes % 60)
+        return record
+
+
+
+    # The records of the given cities, by cityId
+    def records(self, city_codes):
+        result = {}
+        for city_code in city_codes:
+            record = self.get(city_code)
+            if record != None:
+                result[int(city_code)] = record
+        return result
+
+
+
+    # Compact serialisation, so the table can be kept in the response cache
+    def to_json(self):
+        data = {
+            'cityId': self.city_ids.tolist(),
+            'issue': self.issues.tolist(),
+            'strings': self.strings,
+        }
+        for name in _NUMBER_COLUMNS:
+            data[name] = [None if math.isnan(number) else round(number, 1) for number in self.numbers[name]]
+        for name in _STRING_COLUMNS:
+            data[name] = self.string_codes[name].tolist()
+        for name in _TIME_COLUMNS:
+            data[name] = self.times[name].tolist()
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+
+    @classmethod
+    def from_json(cls, body):
+        data = json.loads(body.decode('utf-8'))
+        table = cls()
+        table.city_ids = array('l', data['cityId'])
+        table.issues = array('q', data['issue'])
+        table.strings = data['strings']
+        for code, value in enumerate(table.strings):
+            table.string_index[value] = code
+        for name in _NUMBER_COLUMNS:
+            table.numbers[name] = array('f', [math.nan if number == None else number for number in data[name]])
+        for name in _STRING_COLUMNS:
+            table.string_codes[name] = array('H', data[name])
+        for name in _TIME_COLUMNS:
+            table.times[name] = array('h', data[name])
+        for row, city_id in enumerate(table.city_ids):
+            table.rows[city_id] = row
+        return table
@@ -0,0 +1,182 @@
+"""The properties of the weather things, and where in the downloaded data their values come from."""
+
+from .util import get_long_compass
+
+
+# Used as units, and replaced by the metric or imperial unit, depending on what the user has chosen
+TEMPERATURE_UNIT = 'temperature'
+DISTANCE_UNIT = 'distance'
+
+_UNITS = {
+    TEMPERATURE_UNIT: ('degree celsius', 'degree fahrenheit'),
+    DISTANCE_UNIT: ('kilometer', 'mile'),
+}
+
+
+
+class PropertySpec():
+    """Describes one property of a weather thing.
+    The extractor is called with the data of the feed and whether the metric system is used. It returns the new value, or None to leave the property as it is."""
+
+    def __init__(self, name, label, type, feed, extractor, unit=None, multiple_of=None, at_type=None):
+        self.name = name
+        self.label = label
+        self.type = type
+        self.feed = feed # 'location', 'distance', 'present', 'prediction' or 'status'
+        self.extractor = extractor
+        self.unit = unit
+        self.multiple_of = multiple_of
+        self.at_type = at_type
+
+
+
+    # The property description as the gateway expects it
+    def description(self, metric):
+        description = {}
+        if self.at_type != None:
+            description['@type'] = self.at_type
+        description['label'] = self.label
+        description['type'] = self.type
+        if self.unit in _UNITS:
+            description['unit'] = _UNITS[self.unit][0 if metric else 1]
+        elif self.unit != None:
+            description['unit'] = self.unit
+        description['readOnly'] = True
+        if self.multiple_of != None:
+            description['multipleOf'] = self.multiple_of
+        return description
+
+
+
+#
+#  EXTRACTORS
+#
+
+def _location(location, metric):
+    return str(location.name)
+
+
+def _distance(location, metric):
+    if location.distance == None:
+        return None
+    if metric == False:
+        return round(location.distance / 1.609344, 1) # miles
+    return round(location.distance, 1)
+
+
+def _stale(stale, metric):
+    return bool(stale)
+
+
+# Stations that did not report a value have an empty string instead
+def _number(value):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if number != number: # NaN
+        return None
+    return number
+
+
+def _text(value):
+    if value == None or str(value) == '':
+        return None
+    return str(value)
+
+
+# Sunrise and sunset are given as '06:05'
+def _time_part(city_dict, key, index):
+    if not ':' in str(city_dict.get(key, '')):
+        return None
+    return int(city_dict[key].split(':')[index])
+
+
+def _current_temperature(city_dict, metric):
+    current_temp = _number(city_dict.get('temp'))
+    if current_temp == None:
+        return None
+    if metric == False:
+        current_temp = round((current_temp * 1.8) + 32 ,1) # convert to Fahrenheit
+    return current_temp
+
+
+def _day_temperature(days_list, day, key, metric):
+    if metric == False:
+        key += 'F'
+    return _number(days_list[day].get(key))
+
+
+def _humidity(city_dict, metric):
+    humidity = _number(city_dict.get('rh'))
+    if humidity == None:
+        return None
+    return round(humidity)
+
+
+def _wind_direction(city_dict, metric):
+    direction = _text(city_dict.get('wd'))
+    if direction == None:
+        return None
+    return get_long_compass(direction)
+
+
+def _today_weather(days_list, metric):
+    today_weather = "..."
+    if days_list[0]['weather'] != "":
+        today_weather = days_list[0]['weather']
+    return today_weather
+
+
+def _tomorrow_weather(days_list, metric):
+    tomorrow_weather = "..."
+    if days_list[1]['weather'] != "":
+        tomorrow_weather = days_list[1]['weather']
+    return tomorrow_weather
+
+
+
+#
+#  SPECIFICATIONS
+#
+
+TODAY_PROPERTIES = [
+    PropertySpec('location', 'Location', 'string', 'location', _location),
+    PropertySpec('station_distance', 'Distance to station', 'number', 'distance',
+                 _distance, unit=DISTANCE_UNIT, multiple_of=0.1),
+    PropertySpec('current_description', 'Description', 'string', 'present',
+                 lambda city_dict, metric: _text(city_dict.get('wxdesc'))),
+    PropertySpec('current_humidity', 'Humidity', 'integer', 'present',
+                 _humidity, unit='percent', multiple_of=1),
+    PropertySpec('current_wind_direction', 'Wind direction', 'string', 'present',
+                 _wind_direction),
+    PropertySpec('current_wind_speed', 'Wind speed', 'number', 'present',
+                 lambda city_dict, metric: _number(city_dict.get('ws')), multiple_of=0.1),
+    PropertySpec('current_sunrise_hour', 'Sunrise hour', 'integer', 'present',
+                 lambda city_dict, metric: _time_part(city_dict, 'sunrise', 0), multiple_of=1),
+    PropertySpec('current_sunrise_minute', 'Sunrise minute', 'integer', 'present',
+                 lambda city_dict, metric: _time_part(city_dict, 'sunrise', 1), multiple_of=1),
+    PropertySpec('current_sunset_hour', 'Sunset hour', 'integer', 'present',
+                 lambda city_dict, metric: _time_part(city_dict, 'sunset', 0), multiple_of=1),
+    PropertySpec('current_sunset_minute', 'Sunset minute', 'integer', 'present',
+                 lambda city_dict, metric: _time_part(city_dict, 'sunset', 1), multiple_of=1),
+    PropertySpec('temperature', 'Temperature', 'number', 'present',
+                 _current_temperature, unit=TEMPERATURE_UNIT, multiple_of=0.1, at_type='TemperatureProperty'),
+    PropertySpec('minimum_temperature', 'Minimum temperature', 'number', 'prediction',
+                 lambda days_list, metric: _day_temperature(days_list, 0, 'minTemp', metric), unit=TEMPERATURE_UNIT, multiple_of=0.1),
+    PropertySpec('maximum_temperature', 'Maximum temperature', 'number', 'prediction',
+                 lambda days_list, metric: _day_temperature(days_list, 0, 'maxTemp', metric), unit=TEMPERATURE_UNIT, multiple_of=0.1),
+    PropertySpec('description', 'Weather today', 'string', 'prediction', _today_weather),
+    PropertySpec('stale', 'Outdated', 'boolean', 'status', _stale),
+]
+
+
+TOMORROW_PROPERTIES = [
+    PropertySpec('location', 'Location', 'string', 'location', _location),
+    PropertySpec('weather', 'Weather tomorrow', 'string', 'prediction', _tomorrow_weather),
+    PropertySpec('minimum_temperature', 'Minimum temperature', 'number', 'prediction',
+                 lambda days_list, metric: _day_temperature(days_list, 1, 'minTemp', metric), unit=TEMPERATURE_UNIT, multiple_of=0.1),
+    PropertySpec('maximum_temperature', 'Maximum temperature', 'number', 'prediction',
+                 lambda days_list, metric: _day_temperature(days_list, 1, 'maxTemp', metric), unit=TEMPERATURE_UNIT, multiple_of=0.1, at_type='TemperatureProperty'),
+    PropertySpec('stale', 'Outdated', 'boolean', 'status', _stale),
+]
@@ -0,0 +1,51 @@
+import unittest
+
+from pkg.city_search import CitySearch, normalize
+from pkg.util import match_city
+
+
+
+class CitySearchTest(unittest.TestCase):
+
+    def test_normalize(self):
+        self.assertEqual(normalize('Zürich - Kloten '), 'zurich kloten')
+        self.assertEqual(normalize('Amsterdam (Schiphol)'), 'amsterdam schiphol')
+
+
+    def test_search(self):
+        search = CitySearch(['Netherlands - Amsterdam (Schiphol)', 'Netherlands - Maastricht', 'Switzerland - Zürich'])
+        self.assertEqual(search.search('zurich', 1)[0][0], 'Switzerland - Zürich')
+        self.assertEqual(search.search('Amstredam', 1)[0][0], 'Netherlands - Amsterdam (Schiphol)')
+        self.assertEqual(search.search('', 3), [])
+
+
+
+class MatchCityTest(unittest.TestCase):
+
+    def test_other_cities_in_the_country_are_not_used(self):
+        # the country name alone makes every city in it look similar
+        for name in ('Netherlands - Rotterdam', 'Netherlands - Utrecht', 'Netherlands - Eindhoven'):
+            self.assertIsNone(match_city(name), name)
+
+
+    def test_ambiguous_names(self):
+        self.assertIsNone(match_city('USA - Portland'))
+        self.assertIsNone(match_city('USA - New York'))
+
+
+    def test_country_must_be_right(self):
+        self.assertIsNone(match_city('algiers'))
+        self.assertIsNone(match_city('Nowhere - Foo'))
+        self.assertIsNone(match_city('Netherland - Amsterdam (Schiphol)'))
+
+
+    def test_clear_matches(self):
+        self.assertEqual(match_city('netherlands - amsterdam (schiphol)'), 'Netherlands - Amsterdam (Schiphol)')
+        self.assertEqual(match_city('Netherlands - Amsterdam'), 'Netherlands - Amsterdam (Schiphol)')
+        self.assertEqual(match_city('UK - london'), 'UK - London')
+        self.assertEqual(match_city('USA - San Fransisco'), 'USA - San Francisco, California')
+
+
+
+if __name__ == '__main__':
+    unittest.main()
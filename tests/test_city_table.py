@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from pkg.city_table import pack_city_table, CityTable
+
+
+CITIES = [
+    {'name': 'Netherlands - Amsterdam (Schiphol)', 'city_id': 143, 'latitude': 52.3, 'longitude': 4.77,
+     'time_zone': 120, 'dst': True, 'station': 'Schiphol', 'organisation': 'KNMI'},
+    {'name': 'Netherlands - Maastricht', 'city_id': 1279, 'station': 'Beek', 'organisation': 'KNMI'},
+    {'name': 'Switzerland - Zürich', 'city_id': 242, 'latitude': 47.38, 'longitude': 8.54, 'time_zone': -210, 'dst': False},
+    {'name': 'Algeria - Algiers', 'city_id': 3},
+    {'name': 'Netherlands - De Bilt', 'city_id': 20},
+]
+
+
+
+class CityTableTest(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.bin')
+        with os.fdopen(handle, 'wb') as file:
+            file.write(pack_city_table(CITIES))
+        self.table = CityTable(self.path)
+
+
+    def tearDown(self):
+        self.table.map.close()
+        os.remove(self.path)
+
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.table), len(CITIES))
+        for city in CITIES:
+            row = self.table.find(city['name'])
+            self.assertIsNotNone(row, city['name'])
+            self.assertEqual(self.table.name(row), city['name'])
+            self.assertEqual(self.table.city_id(row), city['city_id'])
+            self.assertEqual(self.table.find_city_id(city['city_id']), row)
+            self.assertEqual(self.table.find_city_id(str(city['city_id'])), row)
+
+
+    def test_missing(self):
+        self.assertIsNone(self.table.find('Netherlands - Utrecht'))
+        self.assertIsNone(self.table.find('Netherlands'))
+        self.assertIsNone(self.table.find(''))
+        self.assertIsNone(self.table.find('Zzz'))
+        for city_id in (0, 2, 21, 1000, 99999):
+            self.assertIsNone(self.table.find_city_id(city_id))
+
+
+    def test_sorted_by_utf8_bytes(self):
+        names = list(self.table.names())
+        self.assertEqual(names, sorted(names, key=lambda name: name.encode('utf-8')))
+        self.assertEqual(self.table.countries(), ['Algeria', 'Netherlands', 'Switzerland'])
+        self.assertEqual(self.table.country_cities('Netherlands'),
+                         ['Netherlands - Amsterdam (Schiphol)', 'Netherlands - De Bilt', 'Netherlands - Maastricht'])
+
+
+    def test_details(self):
+        amsterdam = self.table.details(self.table.find('Netherlands - Amsterdam (Schiphol)'))
+        self.assertAlmostEqual(amsterdam['location'][0], 52.3, places=4)
+        self.assertAlmostEqual(amsterdam['location'][1], 4.77, places=4)
+        self.assertEqual((amsterdam['time_zone'], amsterdam['dst'], amsterdam['station'], amsterdam['organisation']),
+                         (120, True, 'Schiphol', 'KNMI'))
+
+        zurich = self.table.details(self.table.find('Switzerland - Zürich'))
+        self.assertEqual((zurich['time_zone'], zurich['dst'], zurich['station']), (-210, False, None))
+
+        algiers = self.table.details(self.table.find('Algeria - Algiers'))
+        self.assertEqual(algiers, {'location': None, 'time_zone': None, 'dst': None, 'station': None, 'organisation': None})
+
+
+    def test_shipped_table(self):
+        table = CityTable()
+        row = table.find('Netherlands - Amsterdam (Schiphol)')
+        self.assertEqual(table.city_id(row), 143)
+        self.assertEqual(table.find_city_id(143), row)
+        table.map.close()
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from pkg.util import migrate_city_config, get_configured_city
+
+
+class CityConfigTest(unittest.TestCase):
+
+    def test_old_settings_keep_their_city(self):
+        # the gateway adds the new default options to settings that were saved by an older version
+        config = {'Nearest city': 'Belgium - Brussels', 'Country': 'Netherlands', 'City': 'Amsterdam (Schiphol)', 'Metric': True}
+        self.assertTrue(migrate_city_config(config))
+        self.assertEqual(config, {'Country': 'Belgium', 'City': 'Brussels', 'Metric': True})
+        self.assertEqual(get_configured_city(config), 'Belgium - Brussels')
+
+
+    def test_old_settings_without_defaults(self):
+        config = {'Nearest city': 'USA - Portland, Oregon'}
+        self.assertTrue(migrate_city_config(config))
+        self.assertEqual(get_configured_city(config), 'USA - Portland, Oregon')
+
+
+    def test_new_settings(self):
+        config = {'Country': 'Belgium', 'City': 'Brussels'}
+        self.assertFalse(migrate_city_config(config))
+        self.assertEqual(get_configured_city(config), 'Belgium - Brussels')
+        self.assertEqual(get_configured_city({'Country': 'Belgium', 'City': 'Belgium - Brussels'}), 'Belgium - Brussels')
+        self.assertIsNone(get_configured_city({'Country': 'Belgium', 'City': ' '}))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
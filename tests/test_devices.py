@@ -0,0 +1,146 @@
+import unittest
+
+try:
+    from pkg.candle_weather_adapter import CandleWeatherDevice, WeatherLocation
+except ImportError: # the gateway_addon package is only available on the gateway itself
+    CandleWeatherDevice = None
+
+
+MOSCOW = {'cityId': 206, 'issue': '202210210900', 'temp': 3, 'rh': 87, 'wxdesc': 'Overcast', 'wd': 'W', 'ws': '1.0', 'sunrise': '07:12', 'sunset': '17:15'}
+
+
+class Adapter():
+    """Just the adapter settings the things and properties use."""
+
+    DEBUG = False
+
+    def __init__(self, dead_bands=None):
+        self.metric = True
+        self.dead_bands = dead_bands or {}
+        self.latitude = None
+        self.longitude = None
+        self.property_touches = 0
+
+
+
+def create_thing(adapter):
+    thing = CandleWeatherDevice(adapter, WeatherLocation('Russia - Moscow', 206, True))
+    thing.sent = [] # instead of sending notifications to the gateway, they are remembered
+    thing.notify_property_changed = lambda weather_property: thing.sent.append((weather_property.name, weather_property.value))
+    return thing
+
+
+
+@unittest.skipIf(CandleWeatherDevice == None, "the gateway_addon package is not installed")
+class BatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.thing = create_thing(Adapter())
+
+
+    def test_without_batch(self):
+        self.thing.update_properties('present', MOSCOW)
+        self.assertIn(('temperature', 3.0), self.thing.sent)
+        self.assertEqual(self.thing.properties['temperature'].value, 3.0)
+
+
+    def test_one_notification_per_property(self):
+        self.thing.begin_batch()
+        self.thing.update_properties('present', MOSCOW)
+        self.thing.update_properties('present', dict(MOSCOW, temp=4, rh=80))
+        self.thing.update_properties('status', True)
+        self.assertEqual(self.thing.sent, []) # nothing is sent while the batch is open
+        self.assertEqual(self.thing.properties['temperature'].value, None)
+
+        count = self.thing.flush_batch()
+        names = [name for name, value in self.thing.sent]
+        self.assertEqual(count, len(self.thing.sent))
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn(('temperature', 4.0), self.thing.sent)
+        self.assertIn(('current_humidity', 80), self.thing.sent)
+        self.assertIn(('stale', True), self.thing.sent)
+        self.assertEqual(self.thing.properties['temperature'].value, 4.0)
+        self.assertIsNone(self.thing.batch)
+
+
+    def test_change_that_is_undone_is_not_sent(self):
+        self.thing.update_properties('present', MOSCOW)
+        self.thing.sent = []
+
+        self.thing.begin_batch()
+        self.thing.update_properties('present', dict(MOSCOW, temp=4))
+        self.thing.update_properties('present', MOSCOW)
+        self.assertEqual(self.thing.flush_batch(), 0)
+        self.assertEqual(self.thing.sent, [])
+        self.assertEqual(self.thing.properties['temperature'].value, 3.0)
+
+
+    def test_flush_without_batch(self):
+        self.assertEqual(self.thing.flush_batch(), 0)
+        self.assertEqual(self.thing.sent, [])
+
+
+
+@unittest.skipIf(CandleWeatherDevice == None, "the gateway_addon package is not installed")
+class DeadBandTest(unittest.TestCase):
+
+    def setUp(self):
+        self.thing = create_thing(Adapter(dead_bands={'temperature': (0.5, 0.3)}))
+        self.temperature = self.thing.properties['temperature']
+        self.temperature.set_initial_value(10.0)
+
+
+    def test_small_changes_are_not_sent(self):
+        self.temperature.update(10.3)
+        self.assertEqual(self.thing.sent, [])
+        self.assertEqual(self.temperature.value, 10.0)
+        self.assertEqual(self.temperature.true_value, 10.3)
+
+        self.temperature.update(10.5) # exactly the dead-band
+        self.assertEqual(self.thing.sent, [('temperature', 10.5)])
+
+        self.temperature.update(10.9)
+        self.temperature.update(11.0)
+        self.assertEqual(self.thing.sent, [('temperature', 10.5), ('temperature', 11.0)])
+
+
+    def test_hysteresis(self):
+        self.temperature.update(10.5)
+        self.thing.sent = []
+
+        # going back down needs a change of dead-band plus hysteresis
+        self.temperature.update(10.1)
+        self.temperature.update(9.8)
+        self.assertEqual(self.thing.sent, [])
+        self.temperature.update(9.7)
+        self.assertEqual(self.thing.sent, [('temperature', 9.7)])
+
+        # continuing in the same direction only needs the dead-band
+        self.temperature.update(9.2)
+        self.assertEqual(self.thing.sent, [('temperature', 9.7), ('temperature', 9.2)])
+
+
+    def test_flapping_value_is_sent_once(self):
+        for value in (10.5, 10.0, 10.5, 10.0, 10.5):
+            self.temperature.update(value)
+        self.assertEqual(self.thing.sent, [('temperature', 10.5)])
+
+
+    def test_without_dead_band(self):
+        humidity = self.thing.properties['current_humidity']
+        humidity.set_initial_value(87)
+        humidity.update(87)
+        humidity.update(86)
+        self.assertEqual(self.thing.sent, [('current_humidity', 86)])
+
+
+    def test_values_that_are_not_numbers(self):
+        self.assertFalse(self.temperature.is_significant(10.0))
+        self.assertTrue(self.temperature.is_significant('unknown'))
+        self.temperature.set_initial_value(None)
+        self.assertTrue(self.temperature.is_significant(10.1))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import io
+import gzip
+import zlib
+import unittest
+
+from pkg.http_client import DecompressingReader, decoded_stream
+
+
+BODY = b'{"city": {"cityId": 143, "cityName": "Amsterdam"}, "forecast": []}' * 200
+
+
+class FakeResponse(io.BytesIO):
+    """Just enough of an HTTP response: a body that can be read in parts, and headers."""
+
+    def __init__(self, body, encoding=None):
+        io.BytesIO.__init__(self, body)
+        self.headers = {}
+        if encoding != None:
+            self.headers['Content-Encoding'] = encoding
+
+
+
+def raw_deflate(data):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def read_in_parts(reader, size):
+    parts = []
+    while True:
+        part = reader.read(size)
+        if not part:
+            return b''.join(parts)
+        parts.append(part)
+
+
+
+class DecompressingReaderTest(unittest.TestCase):
+
+    def test_gzip(self):
+        reader = DecompressingReader(FakeResponse(gzip.compress(BODY), 'gzip'), 'gzip', chunk_size=64)
+        self.assertEqual(read_in_parts(reader, 100), BODY)
+
+
+    def test_zlib(self):
+        reader = DecompressingReader(FakeResponse(zlib.compress(BODY), 'deflate'), 'deflate', chunk_size=64)
+        self.assertEqual(read_in_parts(reader, 100), BODY)
+
+
+    def test_raw_deflate(self):
+        reader = DecompressingReader(FakeResponse(raw_deflate(BODY), 'deflate'), 'deflate', chunk_size=64)
+        self.assertEqual(read_in_parts(reader, 100), BODY)
+
+
+    def test_raw_deflate_is_only_accepted_as_deflate(self):
+        reader = DecompressingReader(FakeResponse(raw_deflate(BODY), 'gzip'), 'gzip', chunk_size=64)
+        with self.assertRaises(zlib.error):
+            reader.read()
+
+
+    def test_read_everything(self):
+        reader = DecompressingReader(FakeResponse(gzip.compress(BODY), 'gzip'), 'gzip', chunk_size=64)
+        self.assertEqual(reader.read(), BODY)
+        self.assertEqual(reader.read(), b'')
+
+
+    def test_parts_are_not_larger_than_asked(self):
+        reader = DecompressingReader(FakeResponse(zlib.compress(BODY), 'deflate'), 'deflate', chunk_size=4096)
+        part = reader.read(10)
+        self.assertEqual(part, BODY[:10])
+
+
+
+class DecodedStreamTest(unittest.TestCase):
+
+    def test_encodings(self):
+        for encoding, body in (('gzip', gzip.compress(BODY)), ('x-gzip', gzip.compress(BODY)), (' Deflate ', zlib.compress(BODY))):
+            stream = decoded_stream(FakeResponse(body, encoding))
+            self.assertIsInstance(stream, DecompressingReader, encoding)
+            self.assertEqual(stream.read(), BODY, encoding)
+
+
+    def test_uncompressed_response_is_passed_through(self):
+        for encoding in (None, 'identity'):
+            response = FakeResponse(BODY, encoding)
+            self.assertIs(decoded_stream(response), response)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
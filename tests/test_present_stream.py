@@ -0,0 +1,54 @@
+import io
+import json
+import unittest
+
+from pkg.present_stream import scan_present
+
+
+RECORDS = [
+    {'cityId': 143, 'stnName': 'AMSTERDAM', 'temp': 12, 'wxdesc': 'Fine'},
+    {'cityId': 861, 'stnName': 'ABHA', 'temp': '', 'wxdesc': 'Sunny {not a record}'},
+    {'cityId': 242, 'stnName': 'ZÜRICH', 'temp': 8, 'wxdesc': 'Snow }'},
+    {'cityId': 1, 'stnName': 'LAST', 'temp': -3, 'wxdesc': '}}}'},
+]
+
+
+def present_bytes():
+    present = {}
+    for i, record in enumerate(RECORDS):
+        present[str(i)] = record
+    return json.dumps({'present': present}, ensure_ascii=False).encode('utf-8')
+
+
+
+class ScanPresentTest(unittest.TestCase):
+
+    def test_all_records_at_every_chunk_size(self):
+        data = present_bytes()
+        for chunk_size in range(1, 40):
+            records = list(scan_present(io.BytesIO(data), None, chunk_size=chunk_size))
+            self.assertEqual(records, RECORDS, "chunk size " + str(chunk_size))
+
+
+    def test_only_wanted_records(self):
+        data = present_bytes()
+        for chunk_size in (1, 7, 16384):
+            records = list(scan_present(io.BytesIO(data), [242, '1', None], chunk_size=chunk_size))
+            self.assertEqual(records, [RECORDS[2], RECORDS[3]])
+
+
+    def test_stops_once_everything_was_found(self):
+        data = present_bytes()
+        stream = io.BytesIO(data)
+        records = list(scan_present(stream, [143], chunk_size=8))
+        self.assertEqual(records, [RECORDS[0]])
+        self.assertLess(stream.tell(), len(data))
+
+
+    def test_unknown_city(self):
+        self.assertEqual(list(scan_present(io.BytesIO(present_bytes()), [999], chunk_size=5)), [])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
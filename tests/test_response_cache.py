@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from pkg.response_cache import ResponseCache
+
+
+HEADERS = {'ETag': '"abc"', 'Last-Modified': 'Fri, 21 Oct 2022 09:00:00 GMT'}
+
+
+class Clock():
+    """Stands in for time.time, so the test decides how much time passes."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.clock = Clock()
+        patcher = mock.patch('pkg.response_cache.time.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+    def test_time_to_live(self):
+        cache = ResponseCache(self.cache_dir)
+        cache.store('forecast', b'{"city": 143}', HEADERS, ttl=600)
+        self.assertEqual(cache.get_fresh('forecast'), b'{"city": 143}')
+
+        self.clock.now += 600
+        self.assertIsNone(cache.get_fresh('forecast'))
+        self.assertEqual(cache.load('forecast'), b'{"city": 143}') # an expired body can still be used as a fallback
+        self.assertEqual(cache.conditional_headers('forecast'), {'If-None-Match': '"abc"', 'If-Modified-Since': HEADERS['Last-Modified']})
+
+        # a 304 response makes the stored body fresh again
+        cache.touch('forecast', ttl=60)
+        self.assertEqual(cache.get_fresh('forecast'), b'{"city": 143}')
+        self.clock.now += 60
+        self.assertIsNone(cache.get_fresh('forecast'))
+
+        self.assertEqual(cache.stats()['hits'], 2)
+        self.assertEqual(cache.stats()['misses'], 2)
+
+
+    def test_unknown_key(self):
+        cache = ResponseCache(self.cache_dir)
+        self.assertIsNone(cache.get_fresh('nothing'))
+        self.assertIsNone(cache.load('nothing'))
+        self.assertEqual(cache.conditional_headers('nothing'), {})
+
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ResponseCache(self.cache_dir, max_size=30)
+        for key in ('a', 'b', 'c'):
+            cache.store(key, b'0123456789', {})
+            self.clock.now += 1
+
+        cache.load('a') # 'b' is now the least recently used
+        self.clock.now += 1
+        cache.store('d', b'0123456789', {})
+
+        self.assertIsNone(cache.load('b'))
+        self.assertFalse(os.path.isfile(cache.body_path('b')))
+        for key in ('a', 'c', 'd'):
+            self.assertEqual(cache.load(key), b'0123456789', key)
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertEqual(cache.stats()['size'], 30)
+
+
+    def test_index_survives_restart(self):
+        cache = ResponseCache(self.cache_dir)
+        cache.store('forecast', b'{"city": 143}', HEADERS, ttl=600)
+
+        cache = ResponseCache(self.cache_dir)
+        self.assertEqual(cache.get_fresh('forecast'), b'{"city": 143}')
+        self.assertEqual(cache.conditional_headers('forecast')['If-None-Match'], '"abc"')
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import time
+import unittest
+
+from pkg.scheduler import AdaptivePoller, parse_issue_stamp
+
+
+START = 1666224000 # 2022-10-20 00:00 UTC
+
+
+
+class FakeFeed():
+    """Publishes an issue every cadence seconds, lag seconds after its issue time. The stamps may be in another time zone."""
+
+    def __init__(self, cadence=3600, lag=600, offset=0, stamp_format='%Y%m%d%H%M'):
+        self.cadence = cadence
+        self.lag = lag
+        self.offset = offset
+        self.stamp_format = stamp_format
+
+
+    def newest_issue(self, now):
+        return (now - self.lag) // self.cadence * self.cadence
+
+
+    def stamp(self, now):
+        return time.strftime(self.stamp_format, time.gmtime(self.newest_issue(now) + self.offset))
+
+
+
+# Returns, for every issue that was seen, how long after its publication it was first seen, in seconds
+def simulate(feed, period, first_check, hours=24):
+    now = [first_check]
+    poller = AdaptivePoller(period, clock=lambda: now[0])
+    lateness = {}
+    while now[0] < first_check + hours * 3600:
+        issue = feed.newest_issue(now[0])
+        if not issue in lateness:
+            lateness[issue] = now[0] - issue - feed.lag
+        now[0] += poller.observe(feed.stamp(now[0]))
+    return [lateness[issue] for issue in sorted(lateness)]
+
+
+
+class AdaptivePollerTest(unittest.TestCase):
+
+    def assertFresh(self, lateness, limit=900):
+        self.assertLessEqual(max(lateness[-6:]), limit, lateness)
+
+
+    def test_learns_when_data_is_published(self):
+        # fixed hourly checks at :05 would always show the data of the previous hour
+        self.assertFresh(simulate(FakeFeed(), 3600, START + 300))
+
+
+    def test_checks_more_often_than_the_period(self):
+        # checks every 3 hours only see every third issue at first
+        lateness = simulate(FakeFeed(), 3 * 3600, START + 300)
+        self.assertFresh(lateness)
+        self.assertGreaterEqual(len(lateness), 20) # most issues were seen
+
+
+    def test_time_zone_of_the_stamps(self):
+        feed = FakeFeed(offset=-(3 * 3600 + 1800), stamp_format='%Y-%m-%d %H:%M:%S')
+        self.assertFresh(simulate(feed, 3600, START + 300))
+
+
+    def test_lag_longer_than_the_cadence(self):
+        self.assertFresh(simulate(FakeFeed(lag=75 * 60), 3600, START + 300))
+
+
+    def test_unknown_stamps(self):
+        poller = AdaptivePoller(3600, clock=lambda: START)
+        self.assertEqual(poller.observe(None), 3600)
+        self.assertEqual(poller.observe('202210200900'), 3600)
+        self.assertIsNone(parse_issue_stamp(''))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import random
+import unittest
+
+from pkg.spatial_index import SpatialIndex, distance_km
+
+
+
+class SpatialIndexTest(unittest.TestCase):
+
+    def test_nearest_matches_brute_force(self):
+        generator = random.Random(1)
+        points = []
+        for row in range(500):
+            points.append((generator.uniform(-90, 90), generator.uniform(-180, 180), row))
+        # the poles and the date line are where latitude and longitude are awkward
+        points += [(89.9, 10, 500), (-89.9, -170, 501), (0, 179.9, 502), (0, -179.9, 503)]
+        index = SpatialIndex(points)
+        self.assertEqual(len(index), len(points))
+
+        targets = [(generator.uniform(-90, 90), generator.uniform(-180, 180)) for i in range(200)]
+        targets += [(90, 0), (-90, 0), (0, 180), (0, -180), (1, 179.95)]
+        for latitude, longitude in targets:
+            expected = sorted(distance_km(latitude, longitude, point[0], point[1]) for point in points)[:5]
+            found = index.nearest(latitude, longitude, 5)
+            self.assertEqual(len(found), 5)
+            for (distance, row), expected_distance in zip(found, expected):
+                self.assertAlmostEqual(distance, expected_distance, delta=0.001)
+                self.assertAlmostEqual(distance_km(latitude, longitude, points[row][0], points[row][1]), distance, delta=0.001)
+
+
+    def test_small_indexes(self):
+        self.assertEqual(SpatialIndex([]).nearest(52, 5, 3), [])
+        found = SpatialIndex([(52.3, 4.77, 7)]).nearest(52.0, 5.1, 3)
+        self.assertEqual([row for distance, row in found], [7])
+        self.assertAlmostEqual(found[0][0], distance_km(52.0, 5.1, 52.3, 4.77), delta=0.001)
+
+
+    def test_distance(self):
+        self.assertAlmostEqual(distance_km(0, 0, 0, 180), 20015.1, delta=0.1)
+        self.assertAlmostEqual(distance_km(10, 20, 10, 20), 0.0)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
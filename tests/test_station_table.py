@@ -0,0 +1,60 @@
+import unittest
+
+from pkg.station_table import StationTable
+
+
+# From candleweather_update/example_current_datajson. Brussels has no current observation.
+RECORDS = [
+    {'cityId': 861, 'stnId': '41112', 'stnName': 'ABHA', 'issue': '202210210900', 'temp': 21, 'rh': 18, 'wxdesc': 'Fine', 'wd': 'ENE', 'ws': '2.6',
+     'sundate': '20221021', 'sunrise': '06:05', 'sunset': '17:43'},
+    {'cityId': 191, 'stnId': '', 'stnName': '', 'issue': '', 'temp': '', 'rh': '', 'wxdesc': '', 'wd': '', 'ws': '',
+     'sundate': '20221021', 'sunrise': '08:15', 'sunset': '18:38'},
+    {'cityId': 206, 'issue': '202210210900', 'temp': -3.5, 'rh': 87, 'wxdesc': 'Fine', 'wd': 'W', 'ws': '1.0', 'sunrise': '', 'sunset': ''},
+]
+
+
+class StationTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.table = StationTable()
+        for record in RECORDS:
+            self.table.add(record)
+
+
+    def test_records(self):
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.get(861), {'cityId': 861, 'issue': '202210210900', 'temp': 21.0, 'rh': 18.0, 'ws': 2.6,
+                                               'wd': 'ENE', 'wxdesc': 'Fine', 'sunrise': '06:05', 'sunset': '17:43'})
+        self.assertEqual(self.table.get('191'), {'cityId': 191, 'issue': '', 'temp': '', 'rh': '', 'ws': '',
+                                                 'wd': '', 'wxdesc': '', 'sunrise': '08:15', 'sunset': '18:38'})
+        self.assertIsNone(self.table.get(143))
+        self.assertEqual(sorted(self.table.records([206, 143, 191])), [191, 206])
+
+
+    def test_ignores_duplicates_and_broken_records(self):
+        self.table.add({'cityId': 861, 'temp': 99})
+        self.table.add({'temp': 5})
+        self.table.add({'cityId': 'x'})
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.get(861)['temp'], 21.0)
+
+
+    def test_json_round_trip(self):
+        copy = StationTable.from_json(self.table.to_json())
+        self.assertEqual(len(copy), len(self.table))
+        for record in RECORDS:
+            self.assertEqual(copy.get(record['cityId']), self.table.get(record['cityId']))
+        # strings that were stored once are still shared after loading
+        copy.add({'cityId': 1, 'wxdesc': 'Fine', 'wd': 'W'})
+        self.assertEqual(len(copy.strings), len(self.table.strings))
+
+
+    def test_empty_table(self):
+        copy = StationTable.from_json(StationTable().to_json())
+        self.assertEqual(len(copy), 0)
+        self.assertEqual(copy.records([143]), {})
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from pkg.weather_properties import TODAY_PROPERTIES, TOMORROW_PROPERTIES
+
+
+# From candleweather_update/example_current_datajson: Brussels has no current observation
+BRUSSELS = {'cityId': 191, 'stnId': '', 'stnName': '', 'issue': '', 'temp': '', 'rh': '', 'wxdesc': '', 'wxImageCode': '', 'wd': '', 'ws': '',
+            'iconNum': '', 'sundate': '20221021', 'sunrise': '08:15', 'sunset': '18:38', 'moonrise': '', 'moonset': '', 'daynightcode': ''}
+MOSCOW = {'cityId': 206, 'stnId': '27612', 'stnName': 'MOSKVA VDNH', 'issue': '202210210900', 'temp': 3, 'rh': 87, 'wxdesc': 'Overcast', 'wxImageCode': '20',
+          'wd': 'W', 'ws': '1.0', 'iconNum': '2001', 'sundate': '20221021', 'sunrise': '07:12', 'sunset': '17:15', 'moonrise': '', 'moonset': '', 'daynightcode': ''}
+DAYS = [
+    {'forecastDate': '2022-10-21', 'weather': 'Light Rain', 'minTemp': '13', 'maxTemp': '18', 'minTempF': '55', 'maxTempF': '64'},
+    {'forecastDate': '2022-10-22', 'weather': 'Cloudy', 'minTemp': '', 'maxTemp': '', 'minTempF': '', 'maxTempF': ''},
+]
+
+
+def extract(specs, feed, data, metric=True):
+    values = {}
+    for spec in specs:
+        if spec.feed == feed:
+            values[spec.name] = spec.extractor(data, metric)
+    return values
+
+
+
+class ExtractorTest(unittest.TestCase):
+
+    def test_station_without_observation(self):
+        values = extract(TODAY_PROPERTIES, 'present', BRUSSELS)
+        self.assertEqual(values['current_sunrise_hour'], 8)
+        self.assertEqual(values['current_sunset_minute'], 38)
+        for name in ('temperature', 'current_humidity', 'current_wind_speed', 'current_wind_direction', 'current_description'):
+            self.assertIsNone(values[name], name)
+
+
+    def test_station_with_observation(self):
+        values = extract(TODAY_PROPERTIES, 'present', MOSCOW)
+        self.assertEqual(values['temperature'], 3.0)
+        self.assertEqual(values['current_humidity'], 87)
+        self.assertEqual(values['current_wind_speed'], 1.0)
+        self.assertEqual(values['current_wind_direction'], 'West')
+        self.assertEqual(values['current_description'], 'Overcast')
+        self.assertEqual(extract(TODAY_PROPERTIES, 'present', MOSCOW, metric=False)['temperature'], 37.4)
+
+
+    def test_prediction_without_temperatures(self):
+        today = extract(TODAY_PROPERTIES, 'prediction', DAYS)
+        self.assertEqual((today['minimum_temperature'], today['maximum_temperature'], today['description']), (13.0, 18.0, 'Light Rain'))
+        tomorrow = extract(TOMORROW_PROPERTIES, 'prediction', DAYS, metric=False)
+        self.assertEqual((tomorrow['minimum_temperature'], tomorrow['maximum_temperature'], tomorrow['weather']), (None, None, 'Cloudy'))
+
+
+    def test_prediction_of_a_single_day(self):
+        today = extract(TODAY_PROPERTIES, 'prediction', DAYS[:1])
+        self.assertEqual(today['description'], 'Light Rain')
+
+
+
+if __name__ == '__main__':
+    unittest.main()